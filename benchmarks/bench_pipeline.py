@@ -10,39 +10,54 @@ as the scaffolding contributors should use.
 
 from __future__ import annotations
 
+import numpy as np
 import pytest
 
 from epstein_universal_unredaction.payload import (
+    _PAYLOAD_ADAPTER,
+    Candidate,
     DocumentMeta,
+    NormalisedBox,
     PageMeta,
     Payload,
+    RawTextElements,
+    TextBlock,
     TextLayerStatus,
 )
 
 
 def _make_payload_with_pages(n_pages: int, elements_per_page: int) -> Payload:
-    """Build a synthetic payload for benchmarking."""
-    pages = []
-    for i in range(n_pages):
-        elements = [
-            {
-                "text": f"word_{j}",
-                "bbox": {"x": 0.05 * (j % 20), "y": 0.05 * (j // 20), "w": 0.04, "h": 0.02},
-                "font": "Helvetica",
-                "size_pt": 12.0,
-            }
-            for j in range(elements_per_page)
-        ]
-        pages.append(
-            PageMeta(
-                page_number=i,
-                width_mm=210.0,
-                height_mm=297.0,
-                aspect_ratio=210.0 / 297.0,
-                text_layer=TextLayerStatus.PRESENT,
-                raw_text_elements=elements,
-            )
+    """Build a synthetic payload for benchmarking.
+
+    Every page shares the same element layout, so the columns are built once
+    as NumPy arrays (no per-element dicts) and handed to each page.
+    """
+    idx = np.arange(elements_per_page)
+    bbox_xywh = np.empty((elements_per_page, 4), dtype=np.float32)
+    bbox_xywh[:, 0] = (idx % 20) * 0.05
+    bbox_xywh[:, 1] = (idx // 20) * 0.05
+    bbox_xywh[:, 2] = 0.04
+    bbox_xywh[:, 3] = 0.02
+    texts = [f"word_{j}" for j in range(elements_per_page)]
+    fonts = ["Helvetica"] * elements_per_page
+    sizes_pt = np.full(elements_per_page, 12.0, dtype=np.float32)
+
+    pages = [
+        PageMeta(
+            page_number=i,
+            width_mm=210.0,
+            height_mm=297.0,
+            aspect_ratio=210.0 / 297.0,
+            text_layer=TextLayerStatus.PRESENT,
+            raw_text_elements=RawTextElements(
+                texts=texts,
+                bbox_xywh=bbox_xywh,
+                fonts=fonts,
+                sizes_pt=sizes_pt,
+            ),
         )
+        for i in range(n_pages)
+    ]
     return Payload(
         meta=DocumentMeta(
             filename="bench.pdf",
@@ -53,30 +68,118 @@ def _make_payload_with_pages(n_pages: int, elements_per_page: int) -> Payload:
     )
 
 
+# Payloads are built once per module so that warmup and every calibrated
+# round measure only the (de)serialisation call, not payload construction.
+
+
+@pytest.fixture(scope="module")
+def small_payload() -> Payload:
+    return _make_payload_with_pages(5, 50)
+
+
+@pytest.fixture(scope="module")
+def large_payload() -> Payload:
+    return _make_payload_with_pages(50, 200)
+
+
+@pytest.fixture(scope="module")
+def small_payload_json(small_payload: Payload) -> bytes:
+    return small_payload.to_json_bytes()
+
+
 @pytest.mark.benchmark
 class TestPayloadSerialization:
     """Benchmark payload (de)serialisation — a hot path in any pipeline run."""
 
-    def test_serialize_small(self, benchmark) -> None:
-        payload = _make_payload_with_pages(5, 50)
-        benchmark(payload.model_dump_json)
+    def test_serialize_small(self, benchmark, small_payload: Payload) -> None:
+        benchmark(small_payload.to_json_bytes)
+
+    def test_serialize_large(self, benchmark, large_payload: Payload) -> None:
+        benchmark(large_payload.to_json_bytes)
+
+    def test_deserialize_small(self, benchmark, small_payload_json: bytes) -> None:
+        benchmark(Payload.from_json_bytes, small_payload_json)
+
+    def test_serialize_small_fast(self, benchmark, small_payload: Payload) -> None:
+        benchmark(small_payload.to_json_bytes_fast)
+
+    def test_serialize_large_fast(self, benchmark, large_payload: Payload) -> None:
+        benchmark(large_payload.to_json_bytes_fast)
 
-    def test_serialize_large(self, benchmark) -> None:
-        payload = _make_payload_with_pages(50, 200)
-        benchmark(payload.model_dump_json)
+    def test_serialize_small_adapter(self, benchmark, small_payload: Payload) -> None:
+        benchmark(_PAYLOAD_ADAPTER.dump_json, small_payload)
+
+    def test_serialize_large_adapter(self, benchmark, large_payload: Payload) -> None:
+        benchmark(_PAYLOAD_ADAPTER.dump_json, large_payload)
+
+
+@pytest.mark.benchmark
+class TestLeafConstruction:
+    """Per-object construction cost of the types steps build in bulk.
+
+    Step 2 builds one ``TextBlock`` + ``NormalisedBox`` per block and Step 6
+    one ``Candidate`` per kept candidate; compare before changing how these
+    types are declared.
+    """
+
+    def test_normalised_box(self, benchmark) -> None:
+        benchmark(NormalisedBox, x=0.1, y=0.1, w=0.2, h=0.02)
+
+    def test_text_block(self, benchmark) -> None:
+        bbox = NormalisedBox(x=0.1, y=0.1, w=0.2, h=0.02)
+        benchmark(TextBlock, block_id="p0_b0", bbox=bbox, text="word", element_indices=[0, 1])
+
+    def test_candidate(self, benchmark) -> None:
+        benchmark(
+            Candidate, text="John Smith", calculated_width_mm=41.5, width_delta_mm=-0.5, score=0.88
+        )
+
+
+@pytest.mark.benchmark
+class TestStep2Segment:
+    # Segmentation writes page.blocks, so every round gets its own copy and
+    # the shared module-scoped payloads stay untouched for other benchmarks.
+
+    @staticmethod
+    def _bench(benchmark, payload: Payload) -> None:
+        from epstein_universal_unredaction.steps.step2_segment import run
+
+        benchmark.pedantic(
+            run,
+            setup=lambda: ((payload.model_copy(deep=True),), {}),
+            rounds=20,
+            warmup_rounds=2,
+        )
+
+    def test_segment_10_pages(self, benchmark) -> None:
+        self._bench(benchmark, _make_payload_with_pages(10, 100))
+
+    def test_segment_large(self, benchmark, large_payload: Payload) -> None:
+        self._bench(benchmark, large_payload)
+
+    def test_segment_dense_page(self, benchmark) -> None:
+        # 60 lines of 40 elements whose boxes overlap the next line slightly.
+        payload = _make_payload_with_pages(1, 2400)
+        bbox_xywh = payload.pages[0].raw_text_elements.bbox_xywh
+        bbox_xywh[:, 0] = (np.arange(2400) % 40) * 0.025
+        bbox_xywh[:, 1] = (np.arange(2400) // 40) * 0.0165
+        bbox_xywh[:, 3] = 0.018
+        self._bench(benchmark, payload)
+
+
+@pytest.mark.benchmark
+class TestStep3BlockLookup:
+    def test_containing_blocks(self, benchmark) -> None:
+        from epstein_universal_unredaction.steps.step3_redactions import _containing_blocks
 
-    def test_deserialize_small(self, benchmark) -> None:
-        payload = _make_payload_with_pages(5, 50)
-        json_bytes = payload.model_dump_json()
-        benchmark(Payload.model_validate_json, json_bytes)
+        rng = np.random.default_rng(0)
+        blocks = rng.random((200, 4), dtype=np.float32) * 0.5
+        boxes = rng.random((50, 4), dtype=np.float32) * 0.5
+        benchmark(_containing_blocks, blocks, boxes)
 
 
-# Add per-step benchmarks below once implementations exist.
-# Example:
+# Add per-step benchmarks below as further implementations land.
 #
-# @pytest.mark.benchmark
-# class TestStep2Segment:
-#     def test_segment_10_pages(self, benchmark) -> None:
-#         payload = _make_payload_with_pages(10, 100)
-#         from epstein_universal_unredaction.steps.step2_segment import run
-#         benchmark(run, payload)
+# Steps that mutate data they also read need a fresh copy per round,
+# e.g. benchmark.pedantic(run, setup=lambda: ((payload.model_copy(deep=True),), {}),
+# rounds=50, warmup_rounds=5).
@@ -5,13 +5,15 @@ Usage::
     epstein-universal-unredaction run document.pdf
     epstein-universal-unredaction run document.pdf --stop-after segment
     epstein-universal-unredaction run document.pdf --output results.json
+    epstein-universal-unredaction run document.pdf --indent > results.json
+    epstein-universal-unredaction run document.pdf --ndjson > results.ndjson
     epstein-universal-unredaction steps                # list available steps
 """
 
 from __future__ import annotations
 
 import argparse
-import json
+import functools
 import logging
 import sys
 from pathlib import Path
@@ -39,58 +41,85 @@ def _cmd_run(args: argparse.Namespace) -> int:
         print(f"Error: file not found: {pdf_path}", file=sys.stderr)
         return 1
 
-    skip = set(args.skip.split(",")) if args.skip else None
+    skip = (
+        frozenset(name.strip().lower() for name in args.skip.split(",") if name.strip())
+        if args.skip
+        else frozenset()
+    )
 
     try:
         payload = run_pipeline(
             pdf_path,
             stop_after=args.stop_after,
             skip=skip,
+            resume_from=Path(args.resume_from) if args.resume_from else None,
         )
     except NotImplementedError as exc:
         print(f"Pipeline halted (unimplemented step): {exc}", file=sys.stderr)
         return 2
 
-    # Emit output
-    if payload.output is not None:
-        result_json = payload.output.model_dump_json(indent=2)
-    else:
-        # Partial run — dump step_timings as a diagnostic.
-        result_json = json.dumps(
-            {"step_timings": payload.step_timings, "note": "partial run — no consolidated output"},
-            indent=2,
-        )
-
-    if args.output:
-        Path(args.output).write_text(result_json, encoding="utf-8")
-        print(f"Output written to {args.output}")
+    # Emit output — always as encoded bytes, never via an intermediate str.
+    if payload.output is not None and not args.indent:
+        # Streamed from per-result chunks, so the whole document is never
+        # held in memory.
+        stream = payload.output.stream_ndjson if args.ndjson else payload.output.stream_json
+        if args.output:
+            with Path(args.output).open("wb") as fp:
+                stream(fp)
+            print(f"Output written to {args.output}")
+        else:
+            sys.stdout.flush()
+            stream(sys.stdout.buffer)
+            if not args.ndjson:
+                sys.stdout.buffer.write(b"\n")
+            sys.stdout.buffer.flush()
     else:
-        print(result_json)
+        if payload.output is not None:
+            result_bytes = payload.output.to_json_bytes(indent=True)
+        else:
+            # Partial run — dump step_timings as a diagnostic.
+            import orjson
+
+            result_bytes = orjson.dumps(
+                {
+                    "step_timings": dict(payload.step_timings),
+                    "total_elapsed": payload.total_elapsed,
+                    "note": "partial run — no consolidated output",
+                },
+                option=orjson.OPT_INDENT_2,
+            )
+
+        if args.output:
+            Path(args.output).write_bytes(result_bytes)
+            print(f"Output written to {args.output}")
+        else:
+            sys.stdout.flush()
+            sys.stdout.buffer.write(result_bytes)
+            sys.stdout.buffer.write(b"\n")
+            sys.stdout.buffer.flush()
 
     # Print timing summary
     if payload.step_timings:
         print("\n--- Timing Summary ---", file=sys.stderr)
-        for step_name, elapsed in payload.step_timings.items():
-            if step_name == "__total__":
-                continue
+        for step_name, elapsed in payload.step_timings:
             print(f"  {step_name:20s}  {elapsed:.4f}s", file=sys.stderr)
-        total = payload.step_timings.get("__total__")
-        if total is not None:
-            print(f"  {'TOTAL':20s}  {total:.4f}s", file=sys.stderr)
+        print(f"  {'TOTAL':20s}  {payload.total_elapsed:.4f}s", file=sys.stderr)
 
     return 0
 
 
 def _cmd_steps(_args: argparse.Namespace) -> int:
     """Print the ordered list of pipeline steps."""
-    from epstein_universal_unredaction.pipeline import _build_registry
+    from epstein_universal_unredaction.pipeline import _REGISTRY
 
-    for i, step in enumerate(_build_registry(), 1):
+    for i, step in enumerate(_REGISTRY, 1):
         print(f"  {i}. {step.name:15s} — {step.description}")
     return 0
 
 
+@functools.cache
 def build_parser() -> argparse.ArgumentParser:
+    """Return the CLI argument parser (built once per process)."""
     parser = argparse.ArgumentParser(
         prog="epstein-universal-unredaction",
         description="Unredaction pipeline for PDF documents.",
@@ -103,9 +132,21 @@ def build_parser() -> argparse.ArgumentParser:
     run_p = sub.add_parser("run", help="Run the pipeline on a PDF.")
     run_p.add_argument("pdf", help="Path to the input PDF.")
     run_p.add_argument(
-        "-o", "--output",
+        "-o",
+        "--output",
         help="Write JSON output to this file instead of stdout.",
     )
+    layout = run_p.add_mutually_exclusive_group()
+    layout.add_argument(
+        "--ndjson",
+        action="store_true",
+        help="Stream results as newline-delimited JSON (one redaction per line).",
+    )
+    layout.add_argument(
+        "--indent",
+        action="store_true",
+        help="Pretty-print the JSON output (built in memory rather than streamed).",
+    )
     run_p.add_argument(
         "--stop-after",
         metavar="STEP",
@@ -117,7 +158,14 @@ def build_parser() -> argparse.ArgumentParser:
         help="Comma-separated step names to skip.",
     )
     run_p.add_argument(
-        "-v", "--verbose",
+        "--resume-from",
+        metavar="SNAPSHOT",
+        help="Resume from a saved payload snapshot (see EUU_CHECKPOINT_DIR); "
+        "steps it records as completed are skipped.",
+    )
+    run_p.add_argument(
+        "-v",
+        "--verbose",
         action="count",
         default=0,
         help="Increase verbosity (-v info, -vv debug).",
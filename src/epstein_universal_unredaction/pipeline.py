@@ -1,7 +1,12 @@
 """Pipeline orchestrator.
 
 Owns the ordered registry of steps, the routing logic that passes the fat
-payload through each step sequentially, and per-step wall-clock benchmarking.
+payload through each step, and per-step wall-clock benchmarking.
+
+Steps run sequentially by default.  With ``parallel=True`` they are
+scheduled from the payload fields each step declares it reads and writes:
+steps with no data dependency on one another run concurrently in worker
+processes and their outputs are merged back into a single payload.
 
 Usage::
 
@@ -13,22 +18,40 @@ Usage::
 
 from __future__ import annotations
 
+import functools
+import importlib
 import logging
+import operator
+import os
+import stat
 import time
-from collections.abc import Callable
-from dataclasses import dataclass, field
+from collections.abc import Callable, Collection, Sequence
+from dataclasses import dataclass
+from graphlib import TopologicalSorter
 from pathlib import Path
-from typing import Protocol
+from typing import TYPE_CHECKING, Protocol
+
+if TYPE_CHECKING:
+    from concurrent.futures import ProcessPoolExecutor
 
-from epstein_universal_unredaction.payload import Payload
+    from epstein_universal_unredaction.payload import Payload
 
 logger = logging.getLogger(__name__)
 
+# Timings are taken as integer nanoseconds and converted once when stored.
+_NS_PER_S = 1_000_000_000
+
+# If set, a JSON snapshot of the payload is written to
+# ``$EUU_CHECKPOINT_DIR/<step>.json`` after every step that runs; pass one
+# back as ``run_pipeline(resume_from=...)`` to continue from it.
+_CHECKPOINT_ENV = "EUU_CHECKPOINT_DIR"
+
 
 # ---------------------------------------------------------------------------
 # Step protocol — every step module must expose a function with this shape.
 # ---------------------------------------------------------------------------
 
+
 class StepFn(Protocol):
     """Callable signature that every pipeline step must satisfy."""
 
@@ -39,96 +62,309 @@ class StepFn(Protocol):
 # Step descriptor
 # ---------------------------------------------------------------------------
 
+
 @dataclass(frozen=True, slots=True)
 class StepDescriptor:
-    """Metadata for a single pipeline step."""
+    """Metadata for a single pipeline step.
+
+    The step body is referenced by a ``"module:function"`` runner string
+    and only imported when :attr:`fn` is first accessed, so listing steps
+    never pays for importing them (or the payload schema they depend on).
+
+    ``inputs`` and ``outputs`` name the payload fields the step reads and
+    writes, as dotted paths through lists (``"pages.redactions.gap"`` is
+    the ``gap`` of every redaction on every page).  The parallel scheduler
+    derives step ordering from them.
+
+    Kept as a slotted dataclass rather than a ``NamedTuple``: CPython
+    specialises slot reads in the interpreter, making them cheaper than a
+    named tuple's field accessors, and frozen instances are hashable too.
+    """
 
     name: str
     description: str
-    fn: StepFn
+    runner: str
+    inputs: frozenset[str] = frozenset()
+    outputs: frozenset[str] = frozenset()
     # Optional hooks for future extensibility (e.g. pre/post validation).
-    pre_hooks: list[Callable[[Payload], None]] = field(default_factory=list)
-    post_hooks: list[Callable[[Payload], None]] = field(default_factory=list)
+    # Tuples, so the shared empty default is safe and costs no allocation.
+    pre_hooks: tuple[Callable[[Payload], None], ...] = ()
+    post_hooks: tuple[Callable[[Payload], None], ...] = ()
+
+    @property
+    def fn(self) -> StepFn:
+        """The step's entry-point (imports its module on first use)."""
+        return _resolve_runner(self.runner)
+
+    def is_satisfied(self, payload: Payload) -> bool:
+        """True if this step is recorded in ``payload.completed_steps``.
+
+        Completion is recorded explicitly rather than inferred from the
+        outputs, because an empty result (a blank page, a page without
+        redactions, a redaction with no candidates) is a finished result.
+        """
+        return self.name in payload.completed_steps
+
+
+@functools.cache
+def _resolve_runner(runner: str) -> StepFn:
+    """Import and return the callable named by a ``"module:function"`` string."""
+    module, _, attr = runner.partition(":")
+    fn: StepFn = getattr(importlib.import_module(module), attr)
+    return fn
 
 
 # ---------------------------------------------------------------------------
-# Registry — import each step's entry-point and declare ordering.
+# Registry — declare each step's entry-point and ordering.
 # ---------------------------------------------------------------------------
 
-def _build_registry() -> list[StepDescriptor]:
-    """Lazily import step modules and return the ordered registry.
-
-    Lazy imports keep startup fast and let contributors work on one step
-    without needing every dependency installed.
+# Built once at import.  No step module is imported here; see
+# :attr:`StepDescriptor.fn`.  This keeps startup fast and lets contributors
+# work on one step without needing every dependency installed.
+_REGISTRY: tuple[StepDescriptor, ...] = (
+    StepDescriptor(
+        name="ingest",
+        description="Document Ingestion & Triage",
+        runner="epstein_universal_unredaction.steps.step1_ingest:run",
+        outputs=frozenset({"meta", "pages"}),
+    ),
+    StepDescriptor(
+        name="segment",
+        description="Logical Segmentation",
+        runner="epstein_universal_unredaction.steps.step2_segment:run",
+        inputs=frozenset({"pages.raw_text_elements"}),
+        outputs=frozenset({"pages.blocks"}),
+    ),
+    StepDescriptor(
+        name="redactions",
+        description="Redaction ID & Context Extraction",
+        runner="epstein_universal_unredaction.steps.step3_redactions:run",
+        inputs=frozenset({"pages.raw_text_elements", "pages.blocks"}),
+        outputs=frozenset({"pages.redactions"}),
+    ),
+    StepDescriptor(
+        name="typographic",
+        description="Typographic & Spatial Profiling",
+        runner="epstein_universal_unredaction.steps.step4_typographic:run",
+        inputs=frozenset({"pages.raw_text_elements", "pages.redactions"}),
+        outputs=frozenset({"typographic_profile", "pages.redactions.gap"}),
+    ),
+    StepDescriptor(
+        name="classify",
+        description="Semantic Classification",
+        runner="epstein_universal_unredaction.steps.step5_classify:run",
+        inputs=frozenset({"pages.redactions", "typographic_profile"}),
+        outputs=frozenset({"pages.redactions.prediction"}),
+    ),
+    StepDescriptor(
+        name="candidates",
+        description="Dictionary Width Matching",
+        runner="epstein_universal_unredaction.steps.step6_candidates:run",
+        inputs=frozenset({"pages.redactions", "typographic_profile"}),
+        outputs=frozenset({"pages.redactions.candidates"}),
+    ),
+    StepDescriptor(
+        name="consolidate",
+        description="Consolidation",
+        runner="epstein_universal_unredaction.steps.step7_consolidate:run",
+        inputs=frozenset({"meta", "pages", "typographic_profile"}),
+        outputs=frozenset({"output"}),
+    ),
+)
+
+
+def _build_registry() -> tuple[StepDescriptor, ...]:
+    """Return the ordered registry of step descriptors.
+
+    This is the shared :data:`_REGISTRY` built at import, not a fresh copy:
+    calling it repeatedly allocates nothing and imports nothing.  The tuple
+    and its frozen descriptors are immutable; callers that need a different
+    registry (e.g. tests) should build their own tuple.
     """
-    from epstein_universal_unredaction.steps.step1_ingest import run as ingest
-    from epstein_universal_unredaction.steps.step2_segment import run as segment
-    from epstein_universal_unredaction.steps.step3_redactions import run as redactions
-    from epstein_universal_unredaction.steps.step4_typographic import run as typographic
-    from epstein_universal_unredaction.steps.step5_classify import run as classify
-    from epstein_universal_unredaction.steps.step6_candidates import run as candidates
-    from epstein_universal_unredaction.steps.step7_consolidate import run as consolidate
-
-    return [
-        StepDescriptor(
-            name="ingest",
-            description="Document Ingestion & Triage",
-            fn=ingest,
-        ),
-        StepDescriptor(
-            name="segment",
-            description="Logical Segmentation",
-            fn=segment,
-        ),
-        StepDescriptor(
-            name="redactions",
-            description="Redaction ID & Context Extraction",
-            fn=redactions,
-        ),
-        StepDescriptor(
-            name="typographic",
-            description="Typographic & Spatial Profiling",
-            fn=typographic,
-        ),
-        StepDescriptor(
-            name="classify",
-            description="Semantic Classification",
-            fn=classify,
-        ),
-        StepDescriptor(
-            name="candidates",
-            description="Dictionary Width Matching",
-            fn=candidates,
-        ),
-        StepDescriptor(
-            name="consolidate",
-            description="Consolidation",
-            fn=consolidate,
-        ),
-    ]
+    return _REGISTRY
 
 
 # ---------------------------------------------------------------------------
 # Execution helpers
 # ---------------------------------------------------------------------------
 
+
+def _skip_mask(registry: Sequence[StepDescriptor], skip: Collection[str]) -> int:
+    """Return a bitmask with bit *i* set when ``registry[i]`` is in *skip*."""
+    return functools.reduce(
+        operator.or_,
+        (1 << i for i, step in enumerate(registry) if step.name in skip),
+        0,
+    )
+
+
+def _try_skip_cached(step: StepDescriptor, payload: Payload, force_rerun: Collection[str]) -> bool:
+    """Skip *step* without dispatching to it if it has already completed.
+
+    Checked by the coordinator so a cached step costs no hook traversal or
+    step call; it is recorded in ``step_timings`` with zero elapsed time.
+    """
+    if step.name in force_rerun or not step.is_satisfied(payload):
+        return False
+    payload.step_timings.append((step.name, 0.0))
+    logger.info("⏭  Step [%s] already completed (cached)", step.name)
+    return True
+
+
+def _mark_completed(step: StepDescriptor, payload: Payload) -> None:
+    if step.name not in payload.completed_steps:
+        payload.completed_steps.append(step.name)
+
+
+def _write_checkpoint(directory: Path | None, step: StepDescriptor, payload: Payload) -> None:
+    if directory is not None:
+        (directory / f"{step.name}.json").write_bytes(payload.to_json_bytes_fast())
+
+
 def _execute_step(step: StepDescriptor, payload: Payload) -> Payload:
     """Run a single step with timing, logging, and hook execution."""
-    logger.info("┌─ Step [%s]: %s", step.name, step.description)
+    # Checked once per step so that, with INFO suppressed, neither log call
+    # below is made (and no argument tuple is built for it).
+    verbose = logger.isEnabledFor(logging.INFO)
+    if verbose:
+        logger.info("┌─ Step [%s]: %s", step.name, step.description)
 
-    for hook in step.pre_hooks:
-        hook(payload)
+    if step.pre_hooks:
+        for hook in step.pre_hooks:
+            hook(payload)
 
-    t0 = time.perf_counter()
+    t0 = time.perf_counter_ns()
     payload = step.fn(payload)
-    elapsed = time.perf_counter() - t0
+    elapsed = (time.perf_counter_ns() - t0) / _NS_PER_S
 
-    payload.step_timings[step.name] = elapsed
+    payload.step_timings.append((step.name, elapsed))
+    _mark_completed(step, payload)
 
-    for hook in step.post_hooks:
-        hook(payload)
+    if step.post_hooks:
+        for hook in step.post_hooks:
+            hook(payload)
 
-    logger.info("└─ Step [%s] completed in %.4fs", step.name, elapsed)
+    if verbose:
+        logger.info("└─ Step [%s] completed in %.4fs", step.name, elapsed)
+    return payload
+
+
+# ---------------------------------------------------------------------------
+# Parallel scheduling
+# ---------------------------------------------------------------------------
+
+
+def _overlaps(a: frozenset[str], b: frozenset[str]) -> bool:
+    """True if any path in *a* equals, contains, or is contained by one in *b*."""
+    return any(x == y or x.startswith(y + ".") or y.startswith(x + ".") for x in a for y in b)
+
+
+def _dependency_graph(steps: Sequence[StepDescriptor]) -> dict[str, set[str]]:
+    """Map each step name to the earlier steps it must wait for.
+
+    A step depends on an earlier one if it reads what the earlier step
+    writes, writes what it reads, or writes the same field, so concurrent
+    steps never see each other's partial results.
+    """
+    graph: dict[str, set[str]] = {}
+    for j, later in enumerate(steps):
+        graph[later.name] = {
+            earlier.name
+            for earlier in steps[:j]
+            if _overlaps(earlier.outputs, later.inputs | later.outputs)
+            or _overlaps(earlier.inputs, later.outputs)
+        }
+    return graph
+
+
+def _run_isolated(runner: str, payload: Payload) -> tuple[Payload, float]:
+    """Worker-process entry point: run one step on a private payload copy."""
+    fn = _resolve_runner(runner)
+    t0 = time.perf_counter_ns()
+    payload = fn(payload)
+    return payload, (time.perf_counter_ns() - t0) / _NS_PER_S
+
+
+def _assign(target: object, source: object, path: str) -> None:
+    """Copy the field at dotted *path* from *source* onto *target*."""
+    head, _, rest = path.partition(".")
+    if not rest:
+        setattr(target, head, getattr(source, head))
+        return
+    dst, src = getattr(target, head), getattr(source, head)
+    if isinstance(dst, list):
+        for d, s in zip(dst, src, strict=True):
+            _assign(d, s, rest)
+    else:
+        _assign(dst, src, rest)
+
+
+def _execute_concurrently(
+    pool: ProcessPoolExecutor, steps: Sequence[StepDescriptor], payload: Payload
+) -> Payload:
+    """Run mutually independent *steps* in worker processes and merge their outputs."""
+    verbose = logger.isEnabledFor(logging.INFO)
+    for step in steps:
+        if verbose:
+            logger.info("┌─ Step [%s]: %s (concurrent)", step.name, step.description)
+        if step.pre_hooks:
+            for hook in step.pre_hooks:
+                hook(payload)
+
+    # Each submission pickles its own copy of the payload.
+    futures = [pool.submit(_run_isolated, step.runner, payload) for step in steps]
+
+    for step, future in zip(steps, futures, strict=True):
+        result, elapsed = future.result()
+        for path in sorted(step.outputs):
+            _assign(payload, result, path)
+        payload.step_timings.append((step.name, elapsed))
+        _mark_completed(step, payload)
+
+        if step.post_hooks:
+            for hook in step.post_hooks:
+                hook(payload)
+
+        if verbose:
+            logger.info("└─ Step [%s] completed in %.4fs", step.name, elapsed)
+    return payload
+
+
+def _run_scheduled(
+    steps: Sequence[StepDescriptor],
+    payload: Payload,
+    force_rerun: Collection[str],
+    checkpoint_dir: Path | None,
+) -> Payload:
+    """Execute *steps* generation by generation in dependency order.
+
+    Each round takes every step whose dependencies are done.  A lone ready
+    step runs in-process; several are fanned out to a process pool, which
+    is only started the first time that happens.
+    """
+    # Imported here so serial runs never load multiprocessing.
+    from concurrent.futures import ProcessPoolExecutor
+
+    order = {step.name: i for i, step in enumerate(steps)}
+    sorter = TopologicalSorter(_dependency_graph(steps))
+    sorter.prepare()
+    pool: ProcessPoolExecutor | None = None
+    try:
+        while sorter.is_active():
+            names = sorted(sorter.get_ready(), key=order.__getitem__)
+            ready = [steps[order[name]] for name in names]
+            pending = [step for step in ready if not _try_skip_cached(step, payload, force_rerun)]
+            if len(pending) == 1:
+                payload = _execute_step(pending[0], payload)
+            elif pending:
+                pool = pool or ProcessPoolExecutor()
+                payload = _execute_concurrently(pool, pending, payload)
+            for step in pending:
+                _write_checkpoint(checkpoint_dir, step, payload)
+            sorter.done(*names)
+    finally:
+        if pool is not None:
+            pool.shutdown()
     return payload
 
 
@@ -136,14 +372,25 @@ def _execute_step(step: StepDescriptor, payload: Payload) -> Payload:
 # Public API
 # ---------------------------------------------------------------------------
 
-def create_payload(pdf_path: Path) -> Payload:
-    """Initialise a fresh payload seeded with the input PDF path.
+
+def create_payload(pdf_path: Path, resume_from: Path | None = None) -> Payload:
+    """Initialise a payload seeded with the input PDF path.
 
     The *ingest* step will read the file and populate ``meta`` and ``pages``.
     We store the path in a private stash so Step 1 can find it without
     polluting the public schema.
+
+    With *resume_from*, the payload is instead loaded from a saved JSON
+    snapshot (e.g. a checkpoint).  Its ``step_timings`` are cleared so
+    they describe only the run that resumes it.
     """
-    payload = Payload()
+    from epstein_universal_unredaction.payload import Payload
+
+    if resume_from is None:
+        payload = Payload()
+    else:
+        payload = Payload.from_json_bytes(Path(resume_from).read_bytes())
+        payload.step_timings = []
     # Stash the source path for the ingest step.  We use model_config
     # extra='allow' would be one option, but a simple annotation-free
     # attribute is cleaner for a "bag of state".
@@ -155,7 +402,10 @@ def run_pipeline(
     pdf_path: Path,
     *,
     stop_after: str | None = None,
-    skip: set[str] | None = None,
+    skip: Collection[str] | None = None,
+    parallel: bool = False,
+    force_rerun: Collection[str] = (),
+    resume_from: Path | None = None,
 ) -> Payload:
     """Execute the full (or partial) pipeline on *pdf_path*.
 
@@ -166,37 +416,77 @@ def run_pipeline(
     stop_after:
         If given, halt after the named step (e.g. ``"segment"``).
     skip:
-        Set of step names to skip entirely.  Use with caution — later steps
-        may depend on data produced by earlier ones.
+        Step names to skip entirely.  Use with caution — later steps may
+        depend on data produced by earlier ones.
+    parallel:
+        Run steps with no data dependency on each other concurrently in
+        worker processes.  Off by default so that runs (and tests) are
+        deterministic and single-process.  The built-in steps form a strict
+        chain, so for them this currently still runs one step at a time;
+        it is not exposed on the CLI for that reason.
+    force_rerun:
+        Step names to run even if :meth:`StepDescriptor.is_satisfied`
+        reports them as already completed.
+    resume_from:
+        Start from a saved payload snapshot instead of an empty payload.
+        Steps it records as completed are skipped as cached (see
+        *force_rerun*).  Snapshots are written per step when the
+        ``EUU_CHECKPOINT_DIR`` environment variable names a directory.
 
     Returns
     -------
     Payload
         The enriched payload after all executed steps.
     """
-    pdf_path = Path(pdf_path).expanduser().resolve()
-    if not pdf_path.is_file():
+    # Only symlinks need resolve(); anything else just needs an absolute
+    # path, so later steps never depend on the working directory.  Then one
+    # stat (which follows symlinks) instead of is_file().
+    expanded = os.path.expanduser(pdf_path)
+    if os.path.islink(expanded):
+        pdf_path = Path(expanded).resolve()
+    else:
+        pdf_path = Path(os.path.abspath(expanded))
+    try:
+        is_file = stat.S_ISREG(os.stat(pdf_path).st_mode)
+    except (FileNotFoundError, NotADirectoryError):
+        is_file = False
+    if not is_file:
         raise FileNotFoundError(f"PDF not found: {pdf_path}")
 
-    payload = create_payload(pdf_path)
-    registry = _build_registry()
-    skip = skip or set()
+    payload = create_payload(pdf_path, resume_from)
+    skip_mask = _skip_mask(_REGISTRY, skip) if skip else 0
 
-    total_t0 = time.perf_counter()
+    checkpoint_dir: Path | None = None
+    if env_dir := os.environ.get(_CHECKPOINT_ENV):
+        checkpoint_dir = Path(env_dir)
+        checkpoint_dir.mkdir(parents=True, exist_ok=True)
 
-    for step in registry:
-        if step.name in skip:
+    total_t0 = time.perf_counter_ns()
+
+    selected: list[StepDescriptor] = []
+    for i, step in enumerate(_REGISTRY):
+        if skip_mask >> i & 1:
             logger.info("⏭  Skipping step [%s]", step.name)
             continue
 
-        payload = _execute_step(step, payload)
+        selected.append(step)
 
         if stop_after and step.name == stop_after:
-            logger.info("⏹  Stopping after step [%s] as requested.", step.name)
             break
 
-    total_elapsed = time.perf_counter() - total_t0
-    payload.step_timings["__total__"] = total_elapsed
+    if parallel:
+        payload = _run_scheduled(selected, payload, force_rerun, checkpoint_dir)
+    else:
+        for step in selected:
+            if not _try_skip_cached(step, payload, force_rerun):
+                payload = _execute_step(step, payload)
+                _write_checkpoint(checkpoint_dir, step, payload)
+
+    if stop_after and selected and selected[-1].name == stop_after:
+        logger.info("⏹  Stopping after step [%s] as requested.", stop_after)
+
+    total_elapsed = (time.perf_counter_ns() - total_t0) / _NS_PER_S
+    payload.total_elapsed = total_elapsed
     logger.info("Pipeline finished in %.4fs", total_elapsed)
 
     return payload
@@ -204,4 +494,4 @@ def run_pipeline(
 
 def get_step_names() -> list[str]:
     """Return the ordered list of step names (useful for CLI help)."""
-    return [s.name for s in _build_registry()]
+    return [s.name for s in _REGISTRY]
@@ -2,4 +2,35 @@
 
 Each step is a self-contained module that exposes a single ``run(payload)``
 function conforming to :class:`epstein_universal_unredaction.pipeline.StepFn`.
+
+Step modules are loaded on first attribute access (PEP 562), so importing
+this package — or ``from epstein_universal_unredaction import steps`` — does
+not pull in any step's dependencies.
 """
+
+from __future__ import annotations
+
+import importlib
+from types import ModuleType
+
+__all__ = [
+    "step1_ingest",
+    "step2_segment",
+    "step3_redactions",
+    "step4_typographic",
+    "step5_classify",
+    "step6_candidates",
+    "step7_consolidate",
+]
+
+
+def __getattr__(name: str) -> ModuleType:
+    if name in __all__:
+        # import_module binds the submodule on this package, so later
+        # lookups never reach __getattr__ again.
+        return importlib.import_module(f"{__name__}.{name}")
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    return sorted([*globals(), *__all__])
@@ -53,12 +53,15 @@ def run(payload: Payload) -> Payload:
     #       - Convert page dimensions from PDF points (1pt = 1/72 in) to mm.
     #       - Compute aspect_ratio = width_mm / height_mm.
     #       - Detect text_layer quality (present / absent / partial).
-    #       - Extract raw_text_elements with normalised bounding boxes.
-    #         Each element dict should contain at minimum:
-    #           {"text": str, "bbox": {"x": float, "y": float, "w": float, "h": float},
-    #            "font": str, "size_pt": float}
+    #       - Extract raw_text_elements with normalised bounding boxes as a
+    #         RawTextElements column set (one row per span):
+    #           texts: list[str], bbox_xywh: float32 (N, 4) [x, y, w, h],
+    #           fonts: list[str], sizes_pt: float32 (N,)
+    #         Fill the bbox array directly from the extractor's span rects;
+    #         do not build a per-span dict (let alone a nested bbox dict).
+    #         Font names are interned by RawTextElements validation, so pass
+    #         them through as-is.
 
     raise NotImplementedError(
-        "Step 1 (ingest) is not yet implemented.  "
-        "See docstring for specification."
+        "Step 1 (ingest) is not yet implemented.  See docstring for specification."
     )
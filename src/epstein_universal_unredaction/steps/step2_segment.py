@@ -13,23 +13,127 @@ Reads from
 
 Writes to
 ---------
-``payload.blocks_by_page`` — ``dict[page_number, list[TextBlock]]``
+``payload.pages[].blocks`` — ``list[TextBlock]`` per page
 
 Implementation notes
 --------------------
-Clustering can be as simple as a greedy sweep-line that groups elements
-whose vertical overlap exceeds a threshold, or as sophisticated as a
-learned layout model.  The stub raises ``NotImplementedError``.
+A vectorised sweep-line over each page's bbox columns:
+
+1. Sort elements by top edge.  Each element is then paired only with the
+   later elements that start above its bottom edge (found by
+   ``searchsorted``), so only vertically overlapping pairs are examined.
+2. A pair is linked when its vertical overlap exceeds
+   ``_MIN_VERTICAL_OVERLAP`` of the shorter element's height (so a
+   superscript or a neighbouring line does not merge).  Linked elements
+   are grouped into connected components by a vectorised union-find over
+   the edge list.
+3. Each group becomes a block: its elements sorted by ``x`` for reading
+   order, merged bbox via ``reduceat`` min/max reductions, and blocks
+   ordered top-to-bottom, then left-to-right.
+
+Horizontal gaps deliberately do not split a line — the gap left by a
+redaction box must stay inside its block for Step 3.
 """
 
 from __future__ import annotations
 
 import logging
 
-from epstein_universal_unredaction.payload import Payload
+import numpy as np
+import numpy.typing as npt
+
+from epstein_universal_unredaction.payload import NormalisedBox, PageMeta, Payload, TextBlock
 
 logger = logging.getLogger(__name__)
 
+# Fraction of the shorter element's height two elements must share
+# vertically to be considered part of the same line.
+_MIN_VERTICAL_OVERLAP = 0.5
+
+
+def _components(n: int, u: npt.NDArray[np.intp], v: npt.NDArray[np.intp]) -> npt.NDArray[np.intp]:
+    """Label each of *n* nodes with the smallest node in its connected component.
+
+    Union-find over the edge list ``(u[k], v[k])``, vectorised: each round
+    hooks the larger root of every still-split edge onto the smaller one,
+    then compresses paths by pointer jumping until every node points at its
+    root.  Roots only ever point to smaller indices, so no cycles form.
+    """
+    parent = np.arange(n)
+    while True:
+        ru, rv = parent[u], parent[v]
+        split = ru != rv
+        if not split.any():
+            return parent
+        np.minimum.at(parent, np.maximum(ru, rv)[split], np.minimum(ru, rv)[split])
+        while True:
+            grand = parent[parent]
+            if np.array_equal(grand, parent):
+                break
+            parent = grand
+
+
+def _line_labels(y: npt.NDArray[np.float32], h: npt.NDArray[np.float32]) -> npt.NDArray[np.intp]:
+    """Label each element with the index of the first element on its line.
+
+    *y* and *h* must already be sorted by ``y``.
+    """
+    n = len(y)
+    bottom = y + h
+    # Sweep: element i can only overlap the later elements that start above
+    # its bottom edge, i.e. those in ``(i, hi[i])``.
+    first = np.arange(n)
+    hi = np.searchsorted(y, bottom, side="left")
+    counts = np.maximum(hi - first - 1, 0)
+    i = np.repeat(first, counts)
+    j = i + 1 + np.arange(len(i)) - np.repeat(np.cumsum(counts) - counts, counts)
+
+    # y[j] >= y[i], so the shared extent is min(bottoms) - y[j].
+    overlap = np.minimum(bottom[i], bottom[j]) - y[j]
+    linked = overlap > _MIN_VERTICAL_OVERLAP * np.minimum(h[i], h[j])
+    return _components(n, i[linked], j[linked])
+
+
+def _segment_page(page: PageMeta) -> list[TextBlock]:
+    """Cluster one page's raw text elements into blocks."""
+    elements = page.raw_text_elements
+    if not len(elements):
+        return []
+
+    x, y, w, h = elements.bbox_xywh.T
+    by_y = np.argsort(y, kind="stable")
+    labels = np.empty(len(elements), dtype=np.intp)
+    labels[by_y] = by_y[_line_labels(y[by_y], h[by_y])]
+
+    # Group by line, then left-to-right within each line.
+    order = np.lexsort((x, labels))
+    grouped = labels[order]
+    starts = np.flatnonzero(np.r_[True, grouped[1:] != grouped[:-1]])
+    ends = np.r_[starts[1:], len(order)]
+
+    x0 = np.minimum.reduceat(x[order], starts)
+    y0 = np.minimum.reduceat(y[order], starts)
+    x1 = np.clip(np.maximum.reduceat((x + w)[order], starts), 0.0, 1.0)
+    y1 = np.clip(np.maximum.reduceat((y + h)[order], starts), 0.0, 1.0)
+
+    blocks: list[TextBlock] = []
+    for k in np.lexsort((x0, y0)):
+        indices = order[starts[k] : ends[k]].tolist()
+        blocks.append(
+            TextBlock(
+                block_id=f"p{page.page_number}_b{len(blocks)}",
+                bbox=NormalisedBox(
+                    x=float(x0[k]),
+                    y=float(y0[k]),
+                    w=float(x1[k] - x0[k]),
+                    h=float(y1[k] - y0[k]),
+                ),
+                text=" ".join(elements.texts[i] for i in indices),
+                element_indices=indices,
+            )
+        )
+    return blocks
+
 
 def run(payload: Payload) -> Payload:
     """Cluster raw text elements into logical blocks.
@@ -42,25 +146,14 @@ def run(payload: Payload) -> Payload:
     Returns
     -------
     Payload
-        The same payload with ``blocks_by_page`` populated.
+        The same payload with ``blocks`` populated on every page.
     """
     if not payload.pages:
         raise RuntimeError("No pages found — was Step 1 (ingest) run?")
 
     logger.debug("Segmenting %d page(s)", len(payload.pages))
 
-    # TODO: For each page in payload.pages:
-    #   1. Read raw_text_elements.
-    #   2. Cluster elements into logical blocks using spatial proximity.
-    #      Consider: vertical overlap, horizontal gap, font consistency.
-    #   3. For each cluster:
-    #       - Compute merged NormalisedBox (min x/y, max x+w/y+h).
-    #       - Concatenate text in reading order.
-    #       - Record element_indices (pointers back into raw_text_elements).
-    #       - Assign a unique block_id (e.g. "p0_b0", "p0_b1", …).
-    #   4. Store result in payload.blocks_by_page[page_number].
-
-    raise NotImplementedError(
-        "Step 2 (segment) is not yet implemented.  "
-        "See docstring for specification."
-    )
+    for page in payload.pages:
+        page.blocks = _segment_page(page)
+
+    return payload
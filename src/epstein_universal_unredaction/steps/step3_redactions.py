@@ -11,61 +11,182 @@ Responsibilities
 Reads from
 ----------
 ``payload.pages``          — raw page data
-``payload.blocks_by_page`` — logical blocks from Step 2
+``payload.pages[].blocks`` — logical blocks from Step 2
 
 Writes to
 ---------
-``payload.redactions_by_page`` — ``dict[page_number, list[RedactionContext]]``
+``payload.pages[].redactions`` — ``list[RedactionContext]`` per page
 
 Implementation notes
 --------------------
 Black-box detection typically examines PDF drawing commands for filled
-rectangles with RGB (0, 0, 0).  Context extraction must respect block
-boundaries so that text from neighbouring blocks is never mixed in.
+rectangles that are black, i.e. whose fill luminance is at most
+``_BLACK_MAX_LUMA`` (CMYK black does not convert to RGB (0, 0, 0)).
+Drawing ops are staged once per page into a structured array
+(``_DRAW_OP_DTYPE``) so the black-fill test is a single vectorised mask
+rather than a per-op Python filter, and every black box on a page is
+matched to its block in one broadcast overlap computation.  Context
+extraction must respect block boundaries so that text from neighbouring
+blocks is never mixed in.
 """
 
 from __future__ import annotations
 
 import logging
+from collections.abc import Iterable, Mapping, Sequence
+from typing import Any
 
-from epstein_universal_unredaction.payload import Payload
+import numpy as np
+import numpy.typing as npt
+from numpy.lib.recfunctions import structured_to_unstructured
+
+from epstein_universal_unredaction.payload import Payload, TextBlock
 
 logger = logging.getLogger(__name__)
 
 
+# ---------------------------------------------------------------------------
+# Drawing-op staging & black-box detection
+# ---------------------------------------------------------------------------
+
+# One row per drawing op; geometry normalised to [0, 1].
+_DRAW_OP_DTYPE = np.dtype(
+    [
+        ("op_kind", np.uint8),
+        ("r", np.float32),
+        ("g", np.float32),
+        ("b", np.float32),
+        ("x", np.float32),
+        ("y", np.float32),
+        ("w", np.float32),
+        ("h", np.float32),
+    ]
+)
+
+_OP_OTHER = 0
+_OP_FILL_RECT = 1
+
+# Luminance ceiling for a fill to count as black.  Generous enough for
+# CMYK K=100% black, which PyMuPDF converts to about (0.137, 0.122, 0.125).
+_BLACK_MAX_LUMA = 0.2
+# ITU-R BT.601 luma weights for r, g, b.
+_LUMA_WEIGHTS = (0.299, 0.587, 0.114)
+
+
+def _stage_draw_ops(
+    drawings: Iterable[Mapping[str, Any]], page_width_pt: float, page_height_pt: float
+) -> npt.NDArray[np.void]:
+    """Pack PyMuPDF ``page.get_drawings()`` output into a ``_DRAW_OP_DTYPE`` array.
+
+    A path counts as a filled rectangle when it has a fill colour and every
+    item is an ``"re"`` (rectangle) segment.
+    """
+    sx, sy = 1.0 / page_width_pt, 1.0 / page_height_pt
+
+    def rows() -> Iterable[tuple[Any, ...]]:
+        for d in drawings:
+            fill = d.get("fill")
+            rect = d["rect"]
+            is_rect = fill is not None and all(item[0] == "re" for item in d.get("items", ()))
+            r, g, b = fill[:3] if fill is not None else (1.0, 1.0, 1.0)
+            yield (
+                _OP_FILL_RECT if is_rect else _OP_OTHER,
+                r,
+                g,
+                b,
+                rect.x0 * sx,
+                rect.y0 * sy,
+                rect.width * sx,
+                rect.height * sy,
+            )
+
+    return np.fromiter(rows(), dtype=_DRAW_OP_DTYPE)
+
+
+def _black_boxes(ops: npt.NDArray[np.void]) -> npt.NDArray[np.float32]:
+    """Return the ``(N, 4)`` normalised ``x, y, w, h`` of black filled rectangles."""
+    wr, wg, wb = _LUMA_WEIGHTS
+    luma = wr * ops["r"] + wg * ops["g"] + wb * ops["b"]
+    mask = (ops["op_kind"] == _OP_FILL_RECT) & (luma <= _BLACK_MAX_LUMA)
+    boxes: npt.NDArray[np.float32] = structured_to_unstructured(
+        ops[mask][["x", "y", "w", "h"]], dtype=np.float32
+    )
+    return boxes
+
+
+# ---------------------------------------------------------------------------
+# Block lookup
+# ---------------------------------------------------------------------------
+
+
+def _block_boxes(blocks: Sequence[TextBlock]) -> npt.NDArray[np.float32]:
+    """Stack the bboxes of *blocks* as an ``(N, 4)`` ``x, y, w, h`` array."""
+    return np.array(
+        [(b.bbox.x, b.bbox.y, b.bbox.w, b.bbox.h) for b in blocks], dtype=np.float32
+    ).reshape(-1, 4)
+
+
+def _containing_blocks(
+    blocks_xywh: npt.NDArray[np.float32], boxes_xywh: npt.NDArray[np.float32]
+) -> npt.NDArray[np.intp]:
+    """Index of the block overlapping each box by the largest area, or ``-1``.
+
+    Overlap extents for every (block, box) pair come from broadcast
+    ``minimum``/``maximum`` over the ``(N, 4)`` and ``(M, 4)`` arrays, so the
+    lookup for a whole page is a handful of ufunc calls with no per-pair
+    branching.  Ties go to the earlier block.
+    """
+    if not len(blocks_xywh):
+        return np.full(len(boxes_xywh), -1, dtype=np.intp)
+
+    blocks, boxes = blocks_xywh[:, None, :], boxes_xywh[None, :, :]
+    overlap_w = np.minimum(blocks[..., 0] + blocks[..., 2], boxes[..., 0] + boxes[..., 2])
+    overlap_w -= np.maximum(blocks[..., 0], boxes[..., 0])
+    overlap_h = np.minimum(blocks[..., 1] + blocks[..., 3], boxes[..., 1] + boxes[..., 3])
+    overlap_h -= np.maximum(blocks[..., 1], boxes[..., 1])
+    area = np.maximum(overlap_w, 0) * np.maximum(overlap_h, 0)
+
+    best: npt.NDArray[np.intp] = area.argmax(axis=0)
+    best[area[best, np.arange(len(boxes_xywh))] <= 0] = -1
+    return best
+
+
 def run(payload: Payload) -> Payload:
     """Locate redaction boxes and extract their local context.
 
     Parameters
     ----------
     payload:
-        Fat payload with ``pages`` and ``blocks_by_page`` populated.
+        Fat payload with ``pages`` and their ``blocks`` populated.
 
     Returns
     -------
     Payload
-        The same payload with ``redactions_by_page`` populated.
+        The same payload with ``redactions`` populated on every page.
     """
-    if not payload.blocks_by_page:
+    if not any(page.blocks for page in payload.pages):
         raise RuntimeError("No blocks found — was Step 2 (segment) run?")
 
     logger.debug("Detecting redactions across %d page(s)", len(payload.pages))
 
     # TODO: For each page:
-    #   1. Identify filled black rectangles (potential redactions).
-    #      - Look at PDF drawing operations / annotations.
-    #      - Normalise their bounding boxes to [0, 1].
-    #   2. For each black box:
-    #       a. Find the containing TextBlock by checking spatial overlap
-    #          with blocks_by_page[page_number].
+    #   1. Identify filled black rectangles (potential redactions):
+    #          ops = _stage_draw_ops(pdf_page.get_drawings(), w_pt, h_pt)
+    #          boxes = _black_boxes(ops)   # (N, 4) normalised
+    #      (annotations may need the same treatment).
+    #   2. Match every box to its containing TextBlock at once:
+    #          owner = _containing_blocks(_block_boxes(page.blocks), boxes)
+    #      (-1 means no block overlaps the box).  Then for each black box:
+    #       a. Take block = page.blocks[owner[i]].
     #       b. Within that block's raw_text_elements (via element_indices),
     #          find text elements immediately to the left → pre_context,
-    #          and immediately to the right → post_context.
+    #          and immediately to the right → post_context.  Slice the
+    #          columns once per block (bbox_xywh[block.element_indices])
+    #          and compare x edges as arrays, not per element.
     #       c. Build a RedactionContext(redaction_id, bbox,
     #          containing_block_id, pre_context, post_context).
-    #   3. Store result in payload.redactions_by_page[page_number].
+    #   3. Store result in page.redactions.
 
     raise NotImplementedError(
-        "Step 3 (redactions) is not yet implemented.  "
-        "See docstring for specification."
+        "Step 3 (redactions) is not yet implemented.  See docstring for specification."
     )
@@ -10,12 +10,12 @@ Responsibilities
 Reads from
 ----------
 ``payload.pages``              — raw text elements (font / size info)
-``payload.redactions_by_page`` — detected redactions from Step 3
+``payload.pages[].redactions`` — detected redactions from Step 3
 
 Writes to
 ---------
-``payload.typographic_profile``   — :class:`~epstein_universal_unredaction.payload.TypographicProfile`
-``payload.gaps_by_redaction_id``  — ``dict[redaction_id, GapProfile]``
+``payload.typographic_profile``      — :class:`TypographicProfile`
+``payload.pages[].redactions[].gap`` — :class:`GapProfile`
 
 Implementation notes
 --------------------
@@ -40,38 +40,44 @@ def run(payload: Payload) -> Payload:
     Parameters
     ----------
     payload:
-        Fat payload with ``pages`` and ``redactions_by_page`` populated.
+        Fat payload with ``pages`` and their ``redactions`` populated.
 
     Returns
     -------
     Payload
-        The same payload with ``typographic_profile`` and
-        ``gaps_by_redaction_id`` populated.
+        The same payload with ``typographic_profile`` and every
+        redaction's ``gap`` populated.
     """
-    if not payload.redactions_by_page:
+    if not any(page.redactions for page in payload.pages):
         raise RuntimeError("No redactions found — was Step 3 (redactions) run?")
 
     logger.debug("Profiling typography")
 
     # TODO:
     #   1. Global typographic profile:
-    #       a. Tally font names and sizes across all raw_text_elements.
+    #       a. Tally font names and sizes across all raw_text_elements:
+    #          np.unique(elements.fonts, return_counts=True) (likewise sizes_pt).
     #       b. Identify dominant_font and dominant_font_size_pt.
-    #       c. Compute mean_char_width_mm:
-    #          For each text element, width_mm / len(text) → average.
+    #       c. Compute mean_char_width_mm as one reduction over the columns:
+    #          widths_mm = elements.bbox_xywh[:, 2] * page.width_mm
+    #          char_lens = elements.char_counts
+    #          np.average(widths_mm / char_lens, weights=char_lens)
+    #          (skip zero-length spans).
     #       d. Estimate tracking_mm (inter-character spacing) by comparing
     #          measured span widths to expected glyph-only widths.
     #       e. Populate payload.typographic_profile.
     #
     #   2. Per-redaction gap measurement:
-    #       For each redaction in redactions_by_page:
+    #       For each redaction in page.redactions:
     #       a. Convert bbox.w (normalised) → physical mm using page width_mm.
+    #          Convert a page's redactions as one column with
+    #          coords.denormalise_to_mm_array rather than per redaction, and
+    #          hoist any 1 / width_mm reciprocal out of the loop.
     #       b. Estimate character count range:
     #          min_chars = floor(gap_width_mm / max_char_width_mm)
     #          max_chars = ceil(gap_width_mm / min_char_width_mm)
-    #       c. Build GapProfile and store in payload.gaps_by_redaction_id.
+    #       c. Build GapProfile and store it as redaction.gap.
 
     raise NotImplementedError(
-        "Step 4 (typographic) is not yet implemented.  "
-        "See docstring for specification."
+        "Step 4 (typographic) is not yet implemented.  See docstring for specification."
     )
@@ -12,13 +12,13 @@ Responsibilities
 
 Reads from
 ----------
-``payload.redactions_by_page``        — redaction contexts (pre/post text)
-``payload.gaps_by_redaction_id``      — gap measurements
+``payload.pages[].redactions``        — redaction contexts (pre/post text)
+``payload.pages[].redactions[].gap``  — gap measurements
 ``payload.typographic_profile``       — font metrics
 
 Writes to
 ---------
-``payload.predictions_by_redaction_id`` — ``dict[redaction_id, SemanticPrediction]``
+``payload.pages[].redactions[].prediction`` — ``SemanticPrediction``
 
 Implementation notes
 --------------------
@@ -46,26 +46,24 @@ def run(payload: Payload) -> Payload:
     Returns
     -------
     Payload
-        The same payload with ``predictions_by_redaction_id`` populated.
+        The same payload with every redaction's ``prediction`` populated.
     """
-    if not payload.gaps_by_redaction_id:
+    redactions = [r for _, r in payload.iter_redactions()]
+    if not any(r.gap is not None for r in redactions):
         raise RuntimeError("No gap profiles found — was Step 4 (typographic) run?")
 
-    logger.debug(
-        "Classifying %d redaction(s)", len(payload.gaps_by_redaction_id)
-    )
+    logger.debug("Classifying %d redaction(s)", len(redactions))
 
     # TODO: For each redaction:
-    #   1. Retrieve pre_context and post_context from redactions_by_page.
-    #   2. Retrieve GapProfile from gaps_by_redaction_id.
+    #   1. Read redaction.pre_context and redaction.post_context.
+    #   2. Read the GapProfile from redaction.gap.
     #   3. Apply classification rules / model:
     #       - Pattern match context for labels like "Name:", "Phone:", "DOB:", …
     #       - Cross-reference estimated char count with data-type expectations
     #         (e.g. phone numbers are ~10-15 chars, emails vary widely).
     #       - Produce a RedactedDataType and a confidence score.
-    #   4. Store SemanticPrediction in payload.predictions_by_redaction_id.
+    #   4. Store the SemanticPrediction as redaction.prediction.
 
     raise NotImplementedError(
-        "Step 5 (classify) is not yet implemented.  "
-        "See docstring for specification."
+        "Step 5 (classify) is not yet implemented.  See docstring for specification."
     )
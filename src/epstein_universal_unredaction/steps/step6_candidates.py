@@ -11,31 +11,276 @@ Responsibilities
 
 Reads from
 ----------
-``payload.redactions_by_page``          — redaction contexts
-``payload.gaps_by_redaction_id``        — gap measurements
-``payload.predictions_by_redaction_id`` — predicted data types
-``payload.typographic_profile``         — font metrics for width calculation
+``payload.pages[].redactions``              — redaction contexts
+``payload.pages[].redactions[].gap``        — gap measurements
+``payload.pages[].redactions[].prediction`` — predicted data types
+``payload.typographic_profile``             — font metrics for width calculation
 
 Writes to
 ---------
-``payload.candidates_by_redaction_id`` — ``dict[redaction_id, list[Candidate]]``
+``payload.pages[].redactions[].candidates`` — ``list[Candidate]``
 
 Implementation notes
 --------------------
 Width calculation should use the same font-metric source as Step 4 for
-consistency.  Candidates might come from name databases, phone format
+consistency.  Widths are computed for a whole candidate list at once: the
+strings are packed into one UTF-8 byte buffer with offsets, and a per-byte
+width table (with a second level for Latin-1 characters, so accented names
+get their real metrics) turns the per-character sum into a single gather
+and cumulative-sum reduction; with the optional ``jit`` extra the width sum and
+scoring run as one parallel Numba kernel (see ``_step6_kernels``) instead.
+Candidates might come from name databases, phone format
 generators, email pattern generators, etc. depending on the predicted type.
 """
 
 from __future__ import annotations
 
 import logging
+import os
+from collections.abc import Mapping, Sequence
 
-from epstein_universal_unredaction.payload import Payload
+import numpy as np
+import numpy.typing as npt
+
+from epstein_universal_unredaction.payload import (
+    Candidate,
+    Payload,
+    RedactedDataType,
+    RedactionContext,
+)
+from epstein_universal_unredaction.steps import _step6_kernels
 
 logger = logging.getLogger(__name__)
 
 
+# ---------------------------------------------------------------------------
+# Width calculation
+# ---------------------------------------------------------------------------
+
+# True for bytes that start a UTF-8 character (anything but a 0b10xxxxxx
+# continuation byte), so per-byte sums count every character exactly once.
+_CHAR_START: npt.NDArray[np.bool_] = (np.arange(256) & 0xC0) != 0x80
+
+# Width tables are two-level: entries [0, 256) are indexed by byte, and
+# entries from _LATIN1_BASE by Latin-1 code point minus 0x80.  U+0080-U+00FF
+# encode as a 0xC2/0xC3 lead plus one continuation byte; the lead is free
+# and the continuation byte looks up the character's own width.
+_LATIN1_BASE = 256
+_LUT_SIZE = _LATIN1_BASE + 0x80
+
+
+def _width_lut(
+    char_widths_mm: Mapping[str, float], default_width_mm: float
+) -> npt.NDArray[np.float32]:
+    """Build a two-level width table (mm) for UTF-8 encoded candidates.
+
+    Characters up to U+00FF take their width from *char_widths_mm*, falling
+    back to *default_width_mm*.  Any other character is charged
+    *default_width_mm* once, on its lead byte; continuation bytes are free.
+    """
+    lut = np.empty(_LUT_SIZE, dtype=np.float32)
+    lut[:_LATIN1_BASE] = np.where(_CHAR_START, default_width_mm, 0.0)
+    lut[0xC2] = lut[0xC3] = 0.0
+    lut[_LATIN1_BASE:] = default_width_mm
+    for char, width in char_widths_mm.items():
+        if len(char) != 1:
+            continue
+        code = ord(char)
+        if code < 0x80:
+            lut[code] = width
+        elif code <= 0xFF:
+            lut[_LATIN1_BASE + code - 0x80] = width
+    return lut
+
+
+def _lut_keys(buf: npt.NDArray[np.uint8]) -> npt.NDArray[np.intp]:
+    """Index into a :func:`_width_lut` table for every byte of *buf*."""
+    keys = buf.astype(np.intp)
+    prev = np.empty_like(keys)
+    prev[:1] = 0
+    prev[1:] = keys[:-1]
+    # A continuation byte never starts a candidate, so *prev* is its lead.
+    latin1 = ((keys & 0xC0) == 0x80) & ((prev & 0xFE) == 0xC2)
+    keys[latin1] = _LATIN1_BASE + (((prev[latin1] & 1) << 6) | (keys[latin1] & 0x3F))
+    return keys
+
+
+def _pack_strings(
+    texts: Sequence[str],
+) -> tuple[npt.NDArray[np.uint8], npt.NDArray[np.int64]]:
+    """Concatenate *texts* as UTF-8 into one byte buffer plus ``N + 1`` offsets."""
+    encoded = [text.encode() for text in texts]
+    offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+    np.cumsum(np.fromiter(map(len, encoded), dtype=np.int64, count=len(encoded)), out=offsets[1:])
+    return np.frombuffer(b"".join(encoded), dtype=np.uint8), offsets
+
+
+def _candidate_widths(
+    buf: npt.NDArray[np.uint8],
+    offsets: npt.NDArray[np.int64],
+    lut: npt.NDArray[np.float32],
+    tracking_mm: float,
+) -> npt.NDArray[np.float32]:
+    """Width (mm) of every packed candidate: ``sum(char widths) + (n - 1) * tracking``."""
+    per_byte = lut[_lut_keys(buf)] + np.float32(tracking_mm) * _CHAR_START[buf]
+    cumulative = np.zeros(len(buf) + 1, dtype=np.float64)
+    np.cumsum(per_byte, out=cumulative[1:])
+    widths = cumulative[offsets[1:]] - cumulative[offsets[:-1]]
+    # The sum charged tracking after every character; drop the trailing one.
+    widths -= tracking_mm * (offsets[1:] > offsets[:-1])
+    return widths.astype(np.float32)
+
+
+# ---------------------------------------------------------------------------
+# Scoring
+# ---------------------------------------------------------------------------
+
+# Defaults for the Gaussian width tolerance and the number of candidates
+# kept per redaction.
+_SIGMA_MM = 1.0
+_TOP_N = 10
+
+
+def _gaussian_scores(
+    widths: npt.NDArray[np.float32], gap_width_mm: float, sigma_mm: float
+) -> npt.NDArray[np.float32]:
+    """Gaussian falloff on the width delta; zero-width candidates score ``-1``."""
+    deltas = widths - np.float32(gap_width_mm)
+    scores: npt.NDArray[np.float32] = np.exp(-0.5 * np.square(deltas / np.float32(sigma_mm)))
+    scores[widths <= 0] = -1.0
+    return scores
+
+
+def _score_packed(
+    buf: npt.NDArray[np.uint8],
+    offsets: npt.NDArray[np.int64],
+    lut: npt.NDArray[np.float32],
+    tracking_mm: float,
+    gap_width_mm: float,
+    sigma_mm: float = _SIGMA_MM,
+) -> tuple[npt.NDArray[np.float32], npt.NDArray[np.float32]]:
+    """Widths and scores of every packed candidate.
+
+    Uses the compiled kernel when Numba is installed, otherwise
+    :func:`_candidate_widths` followed by :func:`_gaussian_scores`.
+    """
+    kernel = _step6_kernels.score_candidates
+    if kernel is None:
+        widths = _candidate_widths(buf, offsets, lut, tracking_mm)
+        return widths, _gaussian_scores(widths, gap_width_mm, sigma_mm)
+    widths = np.empty(len(offsets) - 1, dtype=np.float32)
+    scores = np.empty_like(widths)
+    kernel(buf, offsets, lut, tracking_mm, gap_width_mm, sigma_mm, widths, scores)
+    return widths, scores
+
+
+def _top_candidates(
+    texts: Sequence[str],
+    widths: npt.NDArray[np.float32],
+    gap_width_mm: float,
+    *,
+    sigma_mm: float = _SIGMA_MM,
+    top_n: int = _TOP_N,
+    scores: npt.NDArray[np.float32] | None = None,
+) -> list[Candidate]:
+    """Score every candidate against the gap and return the best *top_n*.
+
+    Scores are a Gaussian falloff on the width delta, computed for the whole
+    list in one pass unless already given as *scores* (from
+    :func:`_score_packed`).  A ``partition`` finds the *top_n*-th best score
+    in ``O(N)``; candidates above it, plus the earliest of those tied with
+    it, are kept.  Only those are sorted (score descending, then input
+    order) and turned into :class:`Candidate` objects.  Zero-width candidates are dropped.
+    """
+    if scores is None:
+        scores = _gaussian_scores(widths, gap_width_mm, sigma_mm)
+
+    if top_n <= 0:
+        return []
+    if top_n < len(scores):
+        # The top_n-th best score: everything above it is kept, and ties
+        # at it are filled in input order, so the cut is deterministic.
+        cutoff = -np.partition(-scores, top_n - 1)[top_n - 1]
+        above = np.flatnonzero(scores > cutoff)
+        tied = np.flatnonzero(scores == cutoff)[: top_n - len(above)]
+        keep = np.concatenate((above, tied))
+    else:
+        keep = np.arange(len(scores))
+    keep = keep[np.lexsort((keep, -scores[keep]))]
+
+    return [
+        Candidate(
+            text=texts[i],
+            calculated_width_mm=float(widths[i]),
+            width_delta_mm=float(widths[i]) - gap_width_mm,
+            score=float(scores[i]),
+        )
+        for i in keep.tolist()
+        if scores[i] >= 0
+    ]
+
+
+# ---------------------------------------------------------------------------
+# Batching
+# ---------------------------------------------------------------------------
+
+# Target combined candidate count per worker task, overridable from the
+# environment.
+_BATCH_ENV = "EUU_STEP6_BATCH_CANDIDATE_COUNT"
+_BATCH_CANDIDATE_COUNT = 250_000
+
+# Rough candidate-list size per predicted type; only used to balance batches.
+_ESTIMATED_CANDIDATES: dict[RedactedDataType, int] = {
+    RedactedDataType.NAME: 100_000,
+    RedactedDataType.PHONE: 10_000,
+    RedactedDataType.EMAIL: 50_000,
+    RedactedDataType.ADDRESS: 100_000,
+    RedactedDataType.DATE: 40_000,
+    RedactedDataType.ID_NUMBER: 10_000,
+    RedactedDataType.MONETARY: 10_000,
+    RedactedDataType.ORGANISATION: 50_000,
+    RedactedDataType.UNKNOWN: 250_000,
+}
+
+
+def _batch_target() -> int:
+    """Candidate count per batch: ``$EUU_STEP6_BATCH_CANDIDATE_COUNT`` or the default."""
+    return int(os.environ.get(_BATCH_ENV, _BATCH_CANDIDATE_COUNT))
+
+
+def _estimated_candidates(redaction: RedactionContext) -> int:
+    predicted = (
+        redaction.prediction.predicted_type
+        if redaction.prediction is not None
+        else RedactedDataType.UNKNOWN
+    )
+    return _ESTIMATED_CANDIDATES[predicted]
+
+
+def _batch_redactions(
+    redactions: Sequence[RedactionContext], target: int
+) -> list[list[RedactionContext]]:
+    """Group *redactions* into batches of about *target* estimated candidates.
+
+    First-fit decreasing: redactions are taken largest estimate first and
+    placed in the first batch with room left, so many small redactions share
+    one worker task while one at or above *target* gets a batch of its own.
+    """
+    batches: list[list[RedactionContext]] = []
+    loads: list[int] = []
+    for redaction in sorted(redactions, key=_estimated_candidates, reverse=True):
+        cost = _estimated_candidates(redaction)
+        for i, load in enumerate(loads):
+            if load + cost <= target:
+                batches[i].append(redaction)
+                loads[i] += cost
+                break
+        else:
+            batches.append([redaction])
+            loads.append(cost)
+    return batches
+
+
 def run(payload: Payload) -> Payload:
     """Generate and score candidate strings for each redaction.
 
@@ -47,18 +292,19 @@ def run(payload: Payload) -> Payload:
     Returns
     -------
     Payload
-        The same payload with ``candidates_by_redaction_id`` populated.
+        The same payload with every redaction's ``candidates`` populated.
     """
-    if not payload.predictions_by_redaction_id:
+    redactions = [r for _, r in payload.iter_redactions()]
+    if not any(r.prediction is not None for r in redactions):
         raise RuntimeError("No predictions found — was Step 5 (classify) run?")
 
-    logger.debug(
-        "Generating candidates for %d redaction(s)",
-        len(payload.predictions_by_redaction_id),
-    )
+    logger.debug("Generating candidates for %d redaction(s)", len(redactions))
 
-    # TODO: For each redaction:
-    #   1. Look up predicted_type from predictions_by_redaction_id.
+    # TODO: Split the work with _batch_redactions(redactions, _batch_target())
+    #       and submit one worker task per batch, merging the returned
+    #       candidates back by redaction_id.  Within a batch, for each
+    #       redaction:
+    #   1. Read predicted_type from redaction.prediction.
     #   2. Select a candidate source appropriate to that type:
     #       - NAME → name dictionary / census data
     #       - PHONE → phone format generator for relevant locale
@@ -69,16 +315,18 @@ def run(payload: Payload) -> Payload:
     #       - MONETARY → currency format generator
     #       - ORGANISATION → org-name corpus
     #       - UNKNOWN → broad dictionary
-    #   3. For each candidate string:
-    #       a. Calculate typographic width (mm) using font metrics.
-    #          width = sum(char_widths) + (len - 1) * tracking_mm
-    #       b. Compute width_delta_mm = candidate_width - gap_width_mm.
-    #       c. Compute score (e.g. Gaussian falloff on |width_delta_mm|).
-    #       d. Build Candidate object.
-    #   4. Sort by score descending, keep top N.
-    #   5. Store in payload.candidates_by_redaction_id[redaction_id].
+    #      Ship dictionaries as utils.string_bundle bundles: open one
+    #      StringBundle per source and pass bundle.buffer / bundle.offsets
+    #      straight to _score_packed, decoding only the kept entries.
+    #   3. For the candidate list as a whole:
+    #       a. Calculate typographic widths (mm) and scores against the gap:
+    #          lut = _width_lut(char_widths_mm, mean_char_width_mm)  # per font
+    #          widths, scores = _score_packed(
+    #              *_pack_strings(texts), lut, tracking_mm, redaction.gap.gap_width_mm)
+    #       b. Keep the best N:
+    #          redaction.candidates = _top_candidates(
+    #              texts, widths, redaction.gap.gap_width_mm, scores=scores)
 
     raise NotImplementedError(
-        "Step 6 (candidates) is not yet implemented.  "
-        "See docstring for specification."
+        "Step 6 (candidates) is not yet implemented.  See docstring for specification."
     )
@@ -47,11 +47,13 @@ def run(payload: Payload) -> Payload:
     logger.debug("Consolidating results")
 
     # TODO:
-    #   1. Iterate over all redactions across all pages.
-    #   2. For each redaction:
-    #       a. Look up GapProfile from gaps_by_redaction_id.
-    #       b. Look up SemanticPrediction from predictions_by_redaction_id.
-    #       c. Look up Candidates from candidates_by_redaction_id.
+    #   1. Iterate over all redactions in one pass over payload.pages
+    #      (payload.iter_redactions()); everything a result needs hangs
+    #      off the page and redaction objects, so no id lookups are needed.
+    #   2. For each (page, redaction):
+    #       a. gap = redaction.gap
+    #       b. prediction = redaction.prediction
+    #       c. candidates = redaction.candidates
     #       d. Build RedactionResult:
     #           - redaction_id, page_number, bbox
     #           - pre_context, post_context
@@ -65,6 +67,5 @@ def run(payload: Payload) -> Payload:
     #   4. Assign to payload.output.
 
     raise NotImplementedError(
-        "Step 7 (consolidate) is not yet implemented.  "
-        "See docstring for specification."
+        "Step 7 (consolidate) is not yet implemented.  See docstring for specification."
     )
@@ -0,0 +1,59 @@
+"""Apache Arrow export of per-page text elements.
+
+Downstream tooling (notebooks, parquet dumps, CSV export) usually wants the
+raw text spans as a table.  Because :class:`~epstein_universal_unredaction.payload.RawTextElements`
+already stores geometry in contiguous ``float32`` arrays, the bounding boxes
+can be handed to Arrow without materialising a Python float per coordinate.
+
+Requires the optional ``arrow`` extra::
+
+    pip install "epstein-universal-unredaction[arrow]"
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+try:
+    import pyarrow as pa
+except ImportError as exc:
+    raise ImportError(
+        "Arrow export requires pyarrow; install the 'arrow' extra: "
+        "pip install 'epstein-universal-unredaction[arrow]'"
+    ) from exc
+
+if TYPE_CHECKING:
+    from epstein_universal_unredaction.payload import Payload
+
+
+def pages_to_arrow(payload: Payload) -> pa.Table:
+    """Return one row per raw text element across all pages of *payload*.
+
+    Columns: ``page`` (int32), ``text`` (string), ``bbox`` (fixed-size list
+    of four float32 ``x, y, w, h``), ``font`` (dictionary-encoded string),
+    ``size_pt`` (float32).
+    """
+    elements = [page.raw_text_elements for page in payload.pages]
+    page_numbers = np.repeat(
+        np.array([page.page_number for page in payload.pages], dtype=np.int32),
+        [len(e) for e in elements],
+    )
+    flat = pa.array(payload.all_bboxes.ravel(), type=pa.float32())
+    sizes = (
+        np.concatenate([e.sizes_pt for e in elements])
+        if elements
+        else np.empty(0, dtype=np.float32)
+    )
+    return pa.table(
+        {
+            "page": pa.array(page_numbers, type=pa.int32()),
+            "text": pa.array([t for e in elements for t in e.texts], type=pa.string()),
+            "bbox": pa.FixedSizeListArray.from_arrays(flat, 4),
+            "font": pa.array(
+                [f for e in elements for f in e.fonts], type=pa.string()
+            ).dictionary_encode(),
+            "size_pt": pa.array(sizes, type=pa.float32()),
+        }
+    )
@@ -10,11 +10,18 @@ Constants
 ---------
 PT_TO_MM : float
     1 PDF point = 1/72 inch = 0.352778 mm.
+MM_TO_PT : float
+    Reciprocal of ``PT_TO_MM`` (≈ 2.834646), so conversions in either
+    direction are a multiplication.
 """
 
 from __future__ import annotations
 
+import numpy as np
+import numpy.typing as npt
+
 PT_TO_MM: float = 25.4 / 72.0  # ≈ 0.352778
+MM_TO_PT: float = 72.0 / 25.4  # ≈ 2.834646
 
 
 def pts_to_mm(pts: float) -> float:
@@ -24,7 +31,7 @@ def pts_to_mm(pts: float) -> float:
 
 def mm_to_pts(mm: float) -> float:
     """Convert millimetres to PDF points."""
-    return mm / PT_TO_MM
+    return mm * MM_TO_PT
 
 
 def normalise(value: float, page_extent: float) -> float:
@@ -40,3 +47,35 @@ def normalise(value: float, page_extent: float) -> float:
 def denormalise_to_mm(norm: float, page_extent_mm: float) -> float:
     """Convert a normalised ``[0, 1]`` value back to mm."""
     return norm * page_extent_mm
+
+
+# ---------------------------------------------------------------------------
+# Array variants — same semantics as the scalar helpers, applied to a whole
+# column (e.g. ``RawTextElements.bbox_xywh[:, 2]``) in one pass.  The scalar
+# helpers above stay plain Python: for a single value they are much cheaper
+# than a round trip through NumPy.
+# ---------------------------------------------------------------------------
+
+
+def pts_to_mm_array(pts: npt.NDArray[np.floating]) -> npt.NDArray[np.floating]:
+    """Vectorised :func:`pts_to_mm` (e.g. for ``RawTextElements.sizes_pt``)."""
+    mm: npt.NDArray[np.floating] = pts * PT_TO_MM
+    return mm
+
+
+def normalise_array(
+    values: npt.NDArray[np.floating], page_extent: float
+) -> npt.NDArray[np.floating]:
+    """Vectorised :func:`normalise`: divide by *page_extent* and clamp to ``[0, 1]``."""
+    if page_extent <= 0:
+        raise ValueError(f"page_extent must be positive, got {page_extent}")
+    clipped: npt.NDArray[np.floating] = np.clip(values * (1.0 / page_extent), 0.0, 1.0)
+    return clipped
+
+
+def denormalise_to_mm_array(
+    norm: npt.NDArray[np.floating], page_extent_mm: float
+) -> npt.NDArray[np.floating]:
+    """Vectorised :func:`denormalise_to_mm`."""
+    mm: npt.NDArray[np.floating] = norm * page_extent_mm
+    return mm
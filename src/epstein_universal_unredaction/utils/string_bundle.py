@@ -0,0 +1,82 @@
+"""Memory-mapped, read-only string dictionaries.
+
+Candidate sources for Step 6 (name lists, organisation corpora, …) can hold
+hundreds of thousands of entries.  Loading them as Python ``str`` lists
+costs every worker process its own copy.  A *bundle* stores a dictionary
+as two files sharing a stem:
+
+``<stem>.strings.bin``
+    The UTF-8 bytes of every entry, concatenated.
+``<stem>.offsets.npy``
+    ``int64`` array of ``N + 1`` byte offsets into the strings file.
+
+Both are opened with ``mmap``, so every process reading the same bundle maps
+the same read-only page-cache frames and nothing is deserialised up front.
+The byte buffer is in the form Step 6's width calculation consumes directly;
+strings are decoded only for the entries that are actually kept.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Sequence
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import numpy.typing as npt
+
+
+def _paths(stem: Path) -> tuple[Path, Path]:
+    return (
+        stem.with_name(f"{stem.name}.strings.bin"),
+        stem.with_name(f"{stem.name}.offsets.npy"),
+    )
+
+
+def write_bundle(stem: Path, strings: Iterable[str]) -> None:
+    """Write *strings* as a bundle at *stem* (see module docstring)."""
+    strings_path, offsets_path = _paths(stem)
+    lengths = [0]
+    with strings_path.open("wb") as fp:
+        for text in strings:
+            lengths.append(fp.write(text.encode()))
+    np.save(offsets_path, np.cumsum(lengths, dtype=np.int64))
+
+
+class StringBundle:
+    """A read-only, memory-mapped bundle of strings.
+
+    Pickling a bundle (e.g. to send it to a worker process) transfers only
+    its path; the receiving process maps the same files.
+    """
+
+    __slots__ = ("buffer", "offsets", "stem")
+
+    def __init__(self, stem: Path) -> None:
+        strings_path, offsets_path = _paths(stem)
+        self.stem = stem
+        self.offsets: npt.NDArray[np.int64] = np.load(offsets_path, mmap_mode="r")
+        # mmap cannot map an empty file.
+        self.buffer: npt.NDArray[np.uint8] = (
+            np.memmap(strings_path, dtype=np.uint8, mode="r")
+            if strings_path.stat().st_size
+            else np.empty(0, dtype=np.uint8)
+        )
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+    def __getitem__(self, index: int) -> str:
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("bundle index out of range")
+        start, end = self.offsets[index], self.offsets[index + 1]
+        return self.buffer[start:end].tobytes().decode()
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        return (StringBundle, (self.stem,))
+
+    def texts(self, indices: Sequence[int]) -> list[str]:
+        """Decode the entries at *indices*."""
+        return [self[i] for i in indices]
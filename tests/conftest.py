@@ -52,13 +52,19 @@ def sample_page_meta() -> PageMeta:
         raw_text_elements=[
             {
                 "text": "Name:",
-                "bbox": {"x": 0.1, "y": 0.1, "w": 0.08, "h": 0.02},
+                "x": 0.1,
+                "y": 0.1,
+                "w": 0.08,
+                "h": 0.02,
                 "font": "Helvetica",
                 "size_pt": 12.0,
             },
             {
                 "text": "is a resident",
-                "bbox": {"x": 0.4, "y": 0.1, "w": 0.15, "h": 0.02},
+                "x": 0.4,
+                "y": 0.1,
+                "w": 0.15,
+                "h": 0.02,
                 "font": "Helvetica",
                 "size_pt": 12.0,
             },
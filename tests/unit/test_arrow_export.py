@@ -0,0 +1,32 @@
+"""Tests for the Arrow exporter."""
+
+from __future__ import annotations
+
+import pytest
+
+from epstein_universal_unredaction.payload import PageMeta, Payload
+
+pa = pytest.importorskip("pyarrow")
+
+
+class TestPagesToArrow:
+    def test_one_row_per_element(self, payload_after_step1: Payload) -> None:
+        table = payload_after_step1.to_arrow_table()
+        assert table.num_rows == 2
+        assert table.column_names == ["page", "text", "bbox", "font", "size_pt"]
+        assert table["text"].to_pylist() == ["Name:", "is a resident"]
+        assert table["page"].to_pylist() == [0, 0]
+        assert table["font"].to_pylist() == ["Helvetica", "Helvetica"]
+
+    def test_bbox_is_fixed_size_float32(self, payload_after_step1: Payload) -> None:
+        bbox = payload_after_step1.to_arrow_table()["bbox"]
+        assert bbox.type == pa.list_(pa.float32(), 4)
+        assert bbox.to_pylist()[1] == pytest.approx([0.4, 0.1, 0.15, 0.02])
+
+    def test_multiple_pages(self, sample_page_meta: PageMeta) -> None:
+        second = sample_page_meta.model_copy(update={"page_number": 1})
+        table = Payload(pages=[sample_page_meta, second]).to_arrow_table()
+        assert table["page"].to_pylist() == [0, 0, 1, 1]
+
+    def test_empty_payload(self, empty_payload: Payload) -> None:
+        assert empty_payload.to_arrow_table().num_rows == 0
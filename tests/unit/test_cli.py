@@ -2,7 +2,14 @@
 
 from __future__ import annotations
 
-from epstein_universal_unredaction.cli import build_parser
+from pathlib import Path
+
+import orjson
+import pytest
+
+from epstein_universal_unredaction import pipeline
+from epstein_universal_unredaction.cli import build_parser, main
+from epstein_universal_unredaction.payload import DocumentMeta, Payload, PipelineOutput
 
 
 class TestCLIParser:
@@ -14,19 +21,143 @@ class TestCLIParser:
 
     def test_run_with_options(self) -> None:
         parser = build_parser()
-        args = parser.parse_args([
-            "run", "test.pdf",
-            "--stop-after", "segment",
-            "--skip", "classify,candidates",
-            "-o", "out.json",
-            "-vv",
-        ])
+        args = parser.parse_args(
+            [
+                "run",
+                "test.pdf",
+                "--stop-after",
+                "segment",
+                "--skip",
+                "classify,candidates",
+                "-o",
+                "out.json",
+                "-vv",
+            ]
+        )
         assert args.stop_after == "segment"
         assert args.skip == "classify,candidates"
         assert args.output == "out.json"
         assert args.verbose == 2
+        assert args.ndjson is False
+
+    def test_run_ndjson_flag(self) -> None:
+        parser = build_parser()
+        args = parser.parse_args(["run", "test.pdf", "--ndjson"])
+        assert args.ndjson is True
+
+    def test_run_resume_flag(self) -> None:
+        args = build_parser().parse_args(["run", "test.pdf"])
+        assert args.resume_from is None
+        args = build_parser().parse_args(["run", "test.pdf", "--resume-from", "ckpt/x.json"])
+        assert args.resume_from == "ckpt/x.json"
+
+    def test_no_parallel_flag(self) -> None:
+        # The real registry is a strict chain, so the scheduler has nothing
+        # to run concurrently; parallel= stays a library-level hook.
+        with pytest.raises(SystemExit):
+            build_parser().parse_args(["run", "test.pdf", "--parallel"])
+
+    def test_parser_is_cached(self) -> None:
+        assert build_parser() is build_parser()
 
     def test_steps_subcommand(self) -> None:
         parser = build_parser()
         args = parser.parse_args(["steps"])
         assert args.command == "steps"
+
+
+class TestRunCommand:
+    @pytest.fixture()
+    def pdf(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+        pdf = tmp_path / "test.pdf"
+        pdf.write_bytes(b"%PDF-1.4 fake")
+
+        def fake_run_pipeline(pdf_path: Path, **_kwargs: object) -> Payload:
+            return Payload(step_timings=[("ingest", 0.5)], total_elapsed=0.5)
+
+        monkeypatch.setattr(pipeline, "run_pipeline", fake_run_pipeline)
+        return pdf
+
+    def test_partial_run_writes_diagnostic_to_stdout(
+        self, pdf: Path, capsysbinary: pytest.CaptureFixture[bytes]
+    ) -> None:
+        assert main(["run", str(pdf)]) == 0
+        captured = capsysbinary.readouterr()
+        assert captured.out.endswith(b"\n")
+        diagnostic = orjson.loads(captured.out)
+        assert diagnostic["step_timings"] == {"ingest": 0.5}
+        assert diagnostic["total_elapsed"] == 0.5
+        assert b"TOTAL" in captured.err
+
+    def test_skip_names_are_normalised(self, pdf: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        seen: dict[str, object] = {}
+
+        def fake_run_pipeline(pdf_path: Path, **kwargs: object) -> Payload:
+            seen.update(kwargs)
+            return Payload()
+
+        monkeypatch.setattr(pipeline, "run_pipeline", fake_run_pipeline)
+        assert main(["run", str(pdf), "--skip", " Classify, candidates,"]) == 0
+        assert seen["skip"] == frozenset({"classify", "candidates"})
+
+    def test_partial_run_writes_diagnostic_to_file(self, pdf: Path, tmp_path: Path) -> None:
+        out_file = tmp_path / "out.json"
+        assert main(["run", str(pdf), "-o", str(out_file)]) == 0
+        assert orjson.loads(out_file.read_bytes())["step_timings"]["ingest"] == 0.5
+
+    @pytest.fixture()
+    def output(
+        self, pdf: Path, monkeypatch: pytest.MonkeyPatch, sample_document_meta: DocumentMeta
+    ) -> PipelineOutput:
+        output = PipelineOutput(document=sample_document_meta)
+
+        def fake_run_pipeline(pdf_path: Path, **_kwargs: object) -> Payload:
+            return Payload(output=output)
+
+        monkeypatch.setattr(pipeline, "run_pipeline", fake_run_pipeline)
+        return output
+
+    def test_consolidated_output_is_streamed(
+        self,
+        pdf: Path,
+        output: PipelineOutput,
+        monkeypatch: pytest.MonkeyPatch,
+        capsysbinary: pytest.CaptureFixture[bytes],
+    ) -> None:
+        def no_full_dump(*_args: object, **_kwargs: object) -> bytes:
+            raise AssertionError("output should be streamed")
+
+        monkeypatch.setattr(PipelineOutput, "to_json_bytes", no_full_dump)
+        assert main(["run", str(pdf)]) == 0
+        out = capsysbinary.readouterr().out
+        assert out == output.model_dump_json().encode() + b"\n"
+
+    def test_indent_writes_pretty_json(
+        self, pdf: Path, output: PipelineOutput, tmp_path: Path
+    ) -> None:
+        out_file = tmp_path / "out.json"
+        assert main(["run", str(pdf), "--indent", "-o", str(out_file)]) == 0
+        assert PipelineOutput.from_json_bytes(out_file.read_bytes()) == output
+        assert out_file.read_bytes().startswith(b'{\n  "document"')
+
+    def test_indent_and_ndjson_are_exclusive(self) -> None:
+        with pytest.raises(SystemExit):
+            build_parser().parse_args(["run", "test.pdf", "--indent", "--ndjson"])
+
+    def test_ndjson_streams_results(
+        self,
+        pdf: Path,
+        monkeypatch: pytest.MonkeyPatch,
+        capsysbinary: pytest.CaptureFixture[bytes],
+        sample_document_meta: DocumentMeta,
+    ) -> None:
+        output = PipelineOutput(document=sample_document_meta)
+
+        def fake_run_pipeline(pdf_path: Path, **_kwargs: object) -> Payload:
+            return Payload(output=output)
+
+        monkeypatch.setattr(pipeline, "run_pipeline", fake_run_pipeline)
+        assert main(["run", str(pdf), "--ndjson"]) == 0
+        lines = capsysbinary.readouterr().out.splitlines()
+        assert len(lines) == 1
+        assert orjson.loads(lines[0])["document"]["filename"] == "test.pdf"
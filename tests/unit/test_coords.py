@@ -2,13 +2,17 @@
 
 from __future__ import annotations
 
+import numpy as np
 import pytest
 
 from epstein_universal_unredaction.utils.coords import (
     denormalise_to_mm,
+    denormalise_to_mm_array,
     mm_to_pts,
     normalise,
+    normalise_array,
     pts_to_mm,
+    pts_to_mm_array,
 )
 
 
@@ -25,6 +29,17 @@ class TestMmToPts:
     def test_round_trip(self) -> None:
         assert mm_to_pts(pts_to_mm(100.0)) == pytest.approx(100.0)
 
+    def test_known_value(self) -> None:
+        assert mm_to_pts(25.4) == pytest.approx(72.0)
+
+
+class TestPtsToMmArray:
+    def test_matches_scalar(self) -> None:
+        pts = np.array([0.0, 12.0, 72.0], dtype=np.float32)
+        result = pts_to_mm_array(pts)
+        assert result.dtype == np.float32
+        assert result.tolist() == pytest.approx([pts_to_mm(p) for p in (0.0, 12.0, 72.0)])
+
 
 class TestNormalise:
     def test_midpoint(self) -> None:
@@ -47,3 +62,24 @@ class TestDenormaliseToMm:
 
     def test_half_width(self) -> None:
         assert denormalise_to_mm(0.5, 210.0) == pytest.approx(105.0)
+
+
+class TestNormaliseArray:
+    def test_matches_scalar(self) -> None:
+        values = np.array([-10.0, 0.0, 25.0, 50.0, 150.0])
+        expected = [normalise(v, 100.0) for v in values]
+        assert normalise_array(values, 100.0).tolist() == pytest.approx(expected)
+
+    def test_preserves_float32(self) -> None:
+        values = np.array([10.0, 20.0], dtype=np.float32)
+        assert normalise_array(values, 100.0).dtype == np.float32
+
+    def test_rejects_non_positive_extent(self) -> None:
+        with pytest.raises(ValueError, match="positive"):
+            normalise_array(np.array([1.0]), 0.0)
+
+
+class TestDenormaliseToMmArray:
+    def test_matches_scalar(self) -> None:
+        norm = np.array([0.0, 0.5, 1.0])
+        assert denormalise_to_mm_array(norm, 210.0).tolist() == pytest.approx([0.0, 105.0, 210.0])
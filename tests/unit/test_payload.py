@@ -2,6 +2,12 @@
 
 from __future__ import annotations
 
+import io
+import subprocess
+import sys
+
+import numpy as np
+import orjson
 import pytest
 from pydantic import ValidationError
 
@@ -12,9 +18,15 @@ from epstein_universal_unredaction.payload import (
     NormalisedBox,
     PageMeta,
     Payload,
+    PipelineOutput,
+    RawTextElements,
     RedactedDataType,
+    RedactionContext,
+    RedactionResult,
     SemanticPrediction,
+    TextBlock,
     TextLayerStatus,
+    TypographicProfile,
 )
 
 
@@ -35,6 +47,22 @@ class TestNormalisedBox:
         with pytest.raises(ValidationError):
             NormalisedBox(x=0.0, y=0.0, w=1.1, h=0.5)
 
+    def test_rejects_unknown_keys(self) -> None:
+        with pytest.raises(ValidationError):
+            TextBlock.model_validate(
+                {
+                    "block_id": "p0_b0",
+                    "bbox": {"x": 0.1, "y": 0.1, "w": 0.1, "h": 0.1, "z": 0.0},
+                    "text": "abc",
+                }
+            )
+
+    def test_is_frozen_and_slotted(self) -> None:
+        box = NormalisedBox(x=0.1, y=0.2, w=0.3, h=0.4)
+        assert not hasattr(box, "__dict__")
+        with pytest.raises(AttributeError):
+            box.x = 0.5  # type: ignore[misc]
+
 
 class TestDocumentMeta:
     def test_valid(self, sample_document_meta: DocumentMeta) -> None:
@@ -50,6 +78,25 @@ class TestPageMeta:
         assert sample_page_meta.width_mm == 210.0
         assert sample_page_meta.text_layer == TextLayerStatus.PRESENT
 
+    def test_text_layer_is_ordered_int(self, sample_page_meta: PageMeta) -> None:
+        assert sample_page_meta.text_layer >= TextLayerStatus.PARTIAL
+        assert TextLayerStatus.ABSENT < TextLayerStatus.PARTIAL < TextLayerStatus.PRESENT
+
+    def test_text_layer_json_uses_name(self, sample_page_meta: PageMeta) -> None:
+        data = orjson.loads(sample_page_meta.model_dump_json())
+        assert data["text_layer"] == "present"
+        restored = PageMeta.model_validate(data)
+        assert restored.text_layer is TextLayerStatus.PRESENT
+
+    def test_text_layer_accepts_int(self, sample_page_meta: PageMeta) -> None:
+        data = {**sample_page_meta.model_dump(), "text_layer": 1}
+        assert PageMeta.model_validate(data).text_layer is TextLayerStatus.PARTIAL
+
+    def test_text_layer_rejects_unknown_name(self, sample_page_meta: PageMeta) -> None:
+        data = {**sample_page_meta.model_dump(), "text_layer": "garbled"}
+        with pytest.raises(ValidationError, match="unknown text layer status"):
+            PageMeta.model_validate(data)
+
     def test_raw_text_elements_default(self) -> None:
         page = PageMeta(
             page_number=0,
@@ -58,7 +105,73 @@ class TestPageMeta:
             aspect_ratio=1.0,
             text_layer=TextLayerStatus.ABSENT,
         )
-        assert page.raw_text_elements == []
+        assert len(page.raw_text_elements) == 0
+        assert page.raw_text_elements.bbox_xywh.shape == (0, 4)
+
+    def test_raw_text_elements_from_rows(self, sample_page_meta: PageMeta) -> None:
+        elements = sample_page_meta.raw_text_elements
+        assert len(elements) == 2
+        assert elements.texts == ["Name:", "is a resident"]
+        assert elements.fonts == ["Helvetica", "Helvetica"]
+        assert elements.bbox_xywh.dtype == np.float32
+        assert elements.bbox_xywh.shape == (2, 4)
+        assert elements.bbox_xywh[1].tolist() == pytest.approx([0.4, 0.1, 0.15, 0.02])
+        assert elements.char_counts.tolist() == [5, 13]
+
+    def test_raw_text_elements_columns_are_contiguous(self) -> None:
+        wide = np.zeros((3, 8), dtype=np.float64)
+        elements = RawTextElements(
+            texts=["a", "b", "c"],
+            bbox_xywh=wide[:, ::2],
+            fonts=["f"] * 3,
+            sizes_pt=wide[:, 0],
+        )
+        assert elements.bbox_xywh.flags.c_contiguous
+        assert elements.sizes_pt.flags.c_contiguous
+        assert elements.bbox_xywh.dtype == elements.sizes_pt.dtype == np.float32
+
+    def test_raw_text_elements_float32_precision(self) -> None:
+        coords = np.linspace(0.0, 1.0, 1001)
+        elements = RawTextElements(
+            texts=[""] * len(coords),
+            bbox_xywh=np.repeat(coords[:, None], 4, axis=1),
+            fonts=[""] * len(coords),
+            sizes_pt=coords,
+        )
+        restored = RawTextElements.model_validate_json(elements.model_dump_json())
+        assert restored.bbox_xywh.dtype == np.float32
+        assert np.abs(restored.bbox_xywh[:, 0] - coords).max() < 6e-8
+
+    def test_raw_text_elements_interns_fonts(self, sample_page_meta: PageMeta) -> None:
+        restored = PageMeta.model_validate_json(sample_page_meta.model_dump_json())
+        fonts = restored.raw_text_elements.fonts + sample_page_meta.raw_text_elements.fonts
+        assert all(font is fonts[0] for font in fonts)
+
+    def test_raw_text_elements_from_nested_bbox_rows(self) -> None:
+        elements = RawTextElements.model_validate(
+            [
+                {
+                    "text": "x",
+                    "bbox": {"x": 0.1, "y": 0.2, "w": 0.3, "h": 0.4},
+                    "font": "Helvetica",
+                    "size_pt": 10.0,
+                },
+            ]
+        )
+        assert elements.bbox_xywh[0].tolist() == pytest.approx([0.1, 0.2, 0.3, 0.4])
+
+    def test_raw_text_elements_rejects_ragged_columns(self) -> None:
+        with pytest.raises(ValidationError, match="equal length"):
+            RawTextElements(
+                texts=["a", "b"],
+                bbox_xywh=[[0.0, 0.0, 0.1, 0.1]],
+                fonts=["f", "f"],
+                sizes_pt=[10.0, 10.0],
+            )
+
+    def test_round_trip_json(self, sample_page_meta: PageMeta) -> None:
+        restored = PageMeta.model_validate_json(sample_page_meta.model_dump_json())
+        assert restored == sample_page_meta
 
 
 class TestGapProfile:
@@ -88,13 +201,19 @@ class TestSemanticPrediction:
         assert pred.predicted_type == RedactedDataType.UNKNOWN
         assert pred.confidence == 0.0
 
+    def test_stores_enum_value(self) -> None:
+        pred = SemanticPrediction(predicted_type=RedactedDataType.NAME, confidence=0.5)
+        assert type(pred.predicted_type) is str
+        assert pred.predicted_type == RedactedDataType.NAME
+
 
 class TestPayload:
     def test_empty_payload(self, empty_payload: Payload) -> None:
         assert empty_payload.meta is None
         assert empty_payload.pages == []
         assert empty_payload.output is None
-        assert empty_payload.step_timings == {}
+        assert empty_payload.step_timings == []
+        assert empty_payload.total_elapsed == 0.0
 
     def test_partial_payload(self, payload_after_step1: Payload) -> None:
         assert payload_after_step1.meta is not None
@@ -103,8 +222,120 @@ class TestPayload:
         assert payload_after_step1.typographic_profile is None
         assert payload_after_step1.output is None
 
+    def test_results_live_on_owning_objects(
+        self,
+        payload_after_step1: Payload,
+        sample_block: TextBlock,
+        sample_redaction: RedactionContext,
+        sample_gap: GapProfile,
+        sample_candidate: Candidate,
+    ) -> None:
+        page = payload_after_step1.pages[0]
+        page.blocks.append(sample_block)
+        page.redactions.append(sample_redaction)
+        sample_redaction.gap = sample_gap
+        sample_redaction.candidates.append(sample_candidate)
+
+        assert list(payload_after_step1.iter_redactions()) == [(page, sample_redaction)]
+        # Deprecated flat views are derived from the per-object attributes.
+        assert payload_after_step1.blocks_by_page == {0: [sample_block]}
+        assert payload_after_step1.redactions_by_page == {0: [sample_redaction]}
+        assert payload_after_step1.gaps_by_redaction_id == {"p0_r0": sample_gap}
+        assert payload_after_step1.predictions_by_redaction_id == {}
+        assert payload_after_step1.candidates_by_redaction_id == {"p0_r0": [sample_candidate]}
+
+        restored = Payload.from_json_bytes(payload_after_step1.to_json_bytes())
+        assert restored.pages[0].redactions[0].gap == sample_gap
+
     def test_round_trip_json(self, payload_after_step1: Payload) -> None:
         json_str = payload_after_step1.model_dump_json()
         restored = Payload.model_validate_json(json_str)
         assert restored.meta == payload_after_step1.meta
         assert len(restored.pages) == len(payload_after_step1.pages)
+
+    def test_round_trip_json_bytes(self, payload_after_step1: Payload) -> None:
+        data = payload_after_step1.to_json_bytes()
+        assert isinstance(data, bytes)
+        restored = Payload.from_json_bytes(data)
+        assert restored == payload_after_step1
+
+    def test_fast_json_matches_generic(
+        self,
+        payload_after_step1: Payload,
+        sample_redaction: RedactionContext,
+        sample_prediction: SemanticPrediction,
+        sample_typographic_profile: TypographicProfile,
+    ) -> None:
+        payload_after_step1.pages[0].redactions.append(sample_redaction)
+        sample_redaction.prediction = sample_prediction
+        payload_after_step1.typographic_profile = sample_typographic_profile
+        payload_after_step1.step_timings.append(("ingest", 0.25))
+
+        fast = payload_after_step1.to_json_bytes_fast()
+        assert Payload.from_json_bytes(fast) == payload_after_step1
+        generic = orjson.loads(payload_after_step1.to_json_bytes())
+        decoded = orjson.loads(fast)
+        assert decoded.keys() == generic.keys()
+        assert decoded["pages"][0]["text_layer"] == "present"
+        assert decoded["pages"][0]["redactions"] == generic["pages"][0]["redactions"]
+
+    def test_fast_json_resolves_forward_references(self) -> None:
+        # PageMeta refers to TextBlock before it is defined.  Building the
+        # dumpers before any model has been validated must still resolve it.
+        code = (
+            "from epstein_universal_unredaction.payload import *\n"
+            "from epstein_universal_unredaction.payload import _model_dumper\n"
+            "_model_dumper(Payload)\n"
+            "box = NormalisedBox(x=0.1, y=0.1, w=0.2, h=0.02)\n"
+            "page = PageMeta(page_number=0, width_mm=210.0, height_mm=297.0,\n"
+            "                aspect_ratio=0.7, text_layer=TextLayerStatus.PRESENT,\n"
+            "                blocks=[TextBlock(block_id='b', bbox=box, text='t')])\n"
+            "Payload(pages=[page]).to_json_bytes_fast()\n"
+        )
+        subprocess.run([sys.executable, "-c", code], check=True)
+
+    def test_fast_json_handles_strided_arrays(self, sample_page_meta: PageMeta) -> None:
+        elements = sample_page_meta.raw_text_elements
+        elements.sizes_pt = np.array([12.0, 0.0, 12.0, 0.0], dtype=np.float32)[::2]
+        restored = Payload.from_json_bytes(Payload(pages=[sample_page_meta]).to_json_bytes_fast())
+        assert restored.pages[0].raw_text_elements.sizes_pt.tolist() == [12.0, 12.0]
+
+    def test_json_bytes_matches_pydantic(self, payload_after_step1: Payload) -> None:
+        restored = Payload.from_json_bytes(payload_after_step1.model_dump_json())
+        assert restored.to_json_bytes() == payload_after_step1.to_json_bytes()
+
+
+class TestPipelineOutput:
+    @pytest.fixture()
+    def output(self, sample_document_meta: DocumentMeta) -> PipelineOutput:
+        result = RedactionResult(
+            redaction_id="p0_r0",
+            page_number=0,
+            bbox=NormalisedBox(x=0.19, y=0.1, w=0.2, h=0.02),
+            pre_context="Name:",
+            post_context="is a resident",
+            predicted_type=RedactedDataType.NAME,
+            gap_width_mm=42.0,
+        )
+        return PipelineOutput(document=sample_document_meta, results=[result, result])
+
+    def test_json_bytes_matches_model_dump(self, output: PipelineOutput) -> None:
+        assert output.to_json_bytes() == output.model_dump_json().encode()
+        assert output.to_json_bytes(indent=True) == output.model_dump_json(indent=2).encode()
+        assert PipelineOutput.from_json_bytes(output.to_json_bytes(indent=True)) == output
+
+    def test_stream_json_matches_model_dump(self, output: PipelineOutput) -> None:
+        buf = io.BytesIO()
+        output.stream_json(buf)
+        assert buf.getvalue() == output.model_dump_json().encode()
+
+    def test_stream_ndjson(self, output: PipelineOutput) -> None:
+        buf = io.BytesIO()
+        output.stream_ndjson(buf)
+        header, *rows = buf.getvalue().splitlines()
+        assert (
+            PipelineOutput.model_validate(
+                {**orjson.loads(header), "results": [orjson.loads(r) for r in rows]}
+            )
+            == output
+        )
@@ -2,14 +2,79 @@
 
 from __future__ import annotations
 
+import dataclasses
+import itertools
+import logging
+import subprocess
+import sys
+from pathlib import Path
+
 import pytest
 
+from epstein_universal_unredaction import pipeline
+from epstein_universal_unredaction.payload import (
+    DocumentMeta,
+    GapProfile,
+    PageMeta,
+    Payload,
+    PipelineOutput,
+    RedactionContext,
+    SemanticPrediction,
+    TextBlock,
+    TypographicProfile,
+)
 from epstein_universal_unredaction.pipeline import (
+    _REGISTRY,
+    StepDescriptor,
     _build_registry,
+    _dependency_graph,
+    _resolve_runner,
+    _skip_mask,
     create_payload,
     get_step_names,
 )
 
+# Module-level so worker processes can import them by runner string.
+
+
+def _fake_meta(payload: Payload) -> Payload:
+    payload.meta = DocumentMeta(filename="fake.pdf", page_count=1, file_size_bytes=0)
+    return payload
+
+
+def _fake_profile(payload: Payload) -> Payload:
+    payload.typographic_profile = TypographicProfile(dominant_font="Times")
+    return payload
+
+
+def _fake_output(payload: Payload) -> Payload:
+    assert payload.meta is not None and payload.typographic_profile is not None
+    payload.output = PipelineOutput(document=payload.meta)
+    return payload
+
+
+_FAKE_REGISTRY = (
+    StepDescriptor(
+        name="meta",
+        description="",
+        runner=f"{__name__}:_fake_meta",
+        outputs=frozenset({"meta"}),
+    ),
+    StepDescriptor(
+        name="profile",
+        description="",
+        runner=f"{__name__}:_fake_profile",
+        outputs=frozenset({"typographic_profile"}),
+    ),
+    StepDescriptor(
+        name="output",
+        description="",
+        runner=f"{__name__}:_fake_output",
+        inputs=frozenset({"meta", "typographic_profile"}),
+        outputs=frozenset({"output"}),
+    ),
+)
+
 
 class TestRegistry:
     def test_has_seven_steps(self) -> None:
@@ -28,12 +93,96 @@ class TestRegistry:
             "consolidate",
         ]
 
+    def test_registry_is_built_once(self) -> None:
+        assert _build_registry() is _REGISTRY
+        assert isinstance(_REGISTRY, tuple)
+
+    def test_lookups_never_rebuild_descriptors(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(pipeline, "StepDescriptor", None)
+        assert len(_build_registry()) == len(get_step_names()) == 7
+
+    def test_runner_resolves_to_step_run(self) -> None:
+        from epstein_universal_unredaction.steps import step2_segment
+
+        assert _REGISTRY[1].runner == "epstein_universal_unredaction.steps.step2_segment:run"
+        assert _REGISTRY[1].fn is step2_segment.run
+
+    def test_runner_resolution_is_cached(self) -> None:
+        assert _REGISTRY[0].fn is _REGISTRY[0].fn
+        assert _resolve_runner.cache_info().hits > 0
+
     def test_descriptors_have_required_fields(self) -> None:
         for step in _build_registry():
             assert step.name
             assert step.description
             assert callable(step.fn)
 
+    def test_steps_package_loads_modules_on_access(self) -> None:
+        code = (
+            "import sys\n"
+            "from epstein_universal_unredaction import steps\n"
+            "assert 'epstein_universal_unredaction.steps.step6_candidates' not in sys.modules\n"
+            "assert callable(steps.step6_candidates.run)\n"
+            "assert 'epstein_universal_unredaction.steps.step5_classify' not in sys.modules\n"
+        )
+        subprocess.run([sys.executable, "-c", code], check=True)
+
+    def test_listing_steps_imports_no_step_modules(self) -> None:
+        code = (
+            "import sys\n"
+            "from epstein_universal_unredaction.pipeline import get_step_names\n"
+            "get_step_names()\n"
+            "loaded = [m for m in sys.modules\n"
+            "          if m.startswith('epstein_universal_unredaction.steps.')\n"
+            "          or m == 'epstein_universal_unredaction.payload'\n"
+            "          or m == 'concurrent.futures.process']\n"
+            "assert not loaded, loaded\n"
+        )
+        subprocess.run([sys.executable, "-c", code], check=True)
+
+
+class TestIsSatisfied:
+    def test_fresh_payload_satisfies_nothing(self) -> None:
+        payload = Payload()
+        assert not any(step.is_satisfied(payload) for step in _REGISTRY)
+
+    def test_reads_completed_steps(self, sample_document_meta: DocumentMeta) -> None:
+        step = _FAKE_REGISTRY[0]
+        # Outputs alone do not mark a step as done.
+        assert not step.is_satisfied(Payload(meta=sample_document_meta))
+        assert step.is_satisfied(Payload(completed_steps=["meta"]))
+        assert not _FAKE_REGISTRY[1].is_satisfied(Payload(completed_steps=["meta"]))
+
+
+class TestDependencyGraph:
+    def test_independent_steps_share_a_generation(self) -> None:
+        assert _dependency_graph(_FAKE_REGISTRY) == {
+            "meta": set(),
+            "profile": set(),
+            "output": {"meta", "profile"},
+        }
+
+    def test_nested_paths_conflict_with_their_parent(self) -> None:
+        graph = _dependency_graph(_REGISTRY)
+        # typographic writes pages.redactions.gap, which redactions creates.
+        assert "redactions" in graph["typographic"]
+        # candidates writes inside the redactions classify reads.
+        assert "classify" in graph["candidates"]
+
+    def test_registry_chain_has_no_concurrency(self) -> None:
+        graph = _dependency_graph(_REGISTRY)
+        for earlier, later in itertools.pairwise(_REGISTRY):
+            assert earlier.name in graph[later.name]
+
+
+class TestSkipMask:
+    def test_sets_bit_per_skipped_step(self) -> None:
+        registry = _build_registry()
+        assert _skip_mask(registry, {"segment", "classify"}) == 0b10010
+
+    def test_ignores_unknown_names(self) -> None:
+        assert _skip_mask(_build_registry(), {"nope"}) == 0
+
 
 class TestCreatePayload:
     def test_stashes_source_path(self, tmp_path) -> None:
@@ -58,3 +207,223 @@ class TestRunPipeline:
 
         with pytest.raises(FileNotFoundError):
             run_pipeline(Path("/nonexistent/file.pdf"))
+
+    def test_rejects_directory(self, tmp_path) -> None:
+        with pytest.raises(FileNotFoundError):
+            pipeline.run_pipeline(tmp_path)
+
+    def test_expands_user(self, tmp_path, monkeypatch: pytest.MonkeyPatch) -> None:
+        (tmp_path / "test.pdf").write_bytes(b"%PDF-1.4 fake")
+        monkeypatch.setenv("HOME", str(tmp_path))
+        monkeypatch.setattr(pipeline, "_REGISTRY", _FAKE_REGISTRY[:1])
+        payload = pipeline.run_pipeline(Path("~/test.pdf"))
+        assert payload.__dict__["_source_pdf"] == tmp_path / "test.pdf"
+
+    def test_stores_absolute_path(self, tmp_path, monkeypatch: pytest.MonkeyPatch) -> None:
+        (tmp_path / "test.pdf").write_bytes(b"%PDF-1.4 fake")
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.setattr(pipeline, "_REGISTRY", _FAKE_REGISTRY[:1])
+        payload = pipeline.run_pipeline(Path("test.pdf"))
+        assert payload.__dict__["_source_pdf"] == Path.cwd() / "test.pdf"
+        assert payload.__dict__["_source_pdf"].is_absolute()
+
+    def test_resolves_symlink(self, tmp_path, monkeypatch: pytest.MonkeyPatch) -> None:
+        target = tmp_path / "real" / "test.pdf"
+        target.parent.mkdir()
+        target.write_bytes(b"%PDF-1.4 fake")
+        (tmp_path / "link.pdf").symlink_to(target)
+        monkeypatch.setattr(pipeline, "_REGISTRY", _FAKE_REGISTRY[:1])
+        payload = pipeline.run_pipeline(tmp_path / "link.pdf")
+        assert payload.__dict__["_source_pdf"] == target.resolve()
+
+    @pytest.mark.parametrize("parallel", [False, True])
+    def test_skips_completed_steps(
+        self, tmp_path, monkeypatch: pytest.MonkeyPatch, parallel: bool
+    ) -> None:
+        pdf = tmp_path / "test.pdf"
+        pdf.write_bytes(b"%PDF-1.4 fake")
+        snapshot = tmp_path / "meta.json"
+        monkeypatch.setattr(pipeline, "_REGISTRY", _FAKE_REGISTRY[:1])
+        snapshot.write_bytes(pipeline.run_pipeline(pdf).to_json_bytes())
+
+        calls: list[Payload] = []
+        meta = dataclasses.replace(_FAKE_REGISTRY[0], pre_hooks=(calls.append,))
+        monkeypatch.setattr(pipeline, "_REGISTRY", (meta,))
+
+        payload = pipeline.run_pipeline(pdf, parallel=parallel, resume_from=snapshot)
+        assert payload.step_timings == [("meta", 0.0)]
+        assert calls == []
+
+        payload = pipeline.run_pipeline(
+            pdf, parallel=parallel, resume_from=snapshot, force_rerun={"meta"}
+        )
+        assert len(calls) == 1
+        assert payload.completed_steps == ["meta"]
+
+    def test_resumes_from_checkpoint(self, tmp_path, monkeypatch: pytest.MonkeyPatch) -> None:
+        pdf = tmp_path / "test.pdf"
+        pdf.write_bytes(b"%PDF-1.4 fake")
+        checkpoints = tmp_path / "checkpoints"
+        monkeypatch.setenv("EUU_CHECKPOINT_DIR", str(checkpoints))
+        monkeypatch.setattr(pipeline, "_REGISTRY", _FAKE_REGISTRY)
+
+        pipeline.run_pipeline(pdf, stop_after="profile")
+        assert sorted(p.name for p in checkpoints.iterdir()) == ["meta.json", "profile.json"]
+
+        monkeypatch.delenv("EUU_CHECKPOINT_DIR")
+        payload = pipeline.run_pipeline(pdf, resume_from=checkpoints / "profile.json")
+        assert [t for _, t in payload.step_timings][:2] == [0.0, 0.0]
+        assert [name for name, _ in payload.step_timings] == ["meta", "profile", "output"]
+        assert payload.output is not None
+        assert payload.__dict__["_source_pdf"] == pdf
+
+    @pytest.mark.parametrize(
+        "stop_after", ["segment", "redactions", "typographic", "classify", "candidates"]
+    )
+    def test_resume_keeps_empty_results(
+        self,
+        tmp_path,
+        monkeypatch: pytest.MonkeyPatch,
+        stop_after: str,
+        sample_document_meta: DocumentMeta,
+        sample_page_meta: PageMeta,
+        sample_block: TextBlock,
+        sample_redaction: RedactionContext,
+        sample_gap: GapProfile,
+        sample_typographic_profile: TypographicProfile,
+        sample_prediction: SemanticPrediction,
+    ) -> None:
+        # Page 0 is blank (no blocks, so no redactions); page 1 has one
+        # redaction, which ends up with zero candidates.
+        pdf = tmp_path / "test.pdf"
+        pdf.write_bytes(b"%PDF-1.4 fake")
+        calls: list[str] = []
+
+        def ingest(payload: Payload) -> Payload:
+            payload.meta = sample_document_meta
+            blank = sample_page_meta.model_copy(update={"page_number": 0})
+            payload.pages = [blank, sample_page_meta.model_copy(update={"page_number": 1})]
+            return payload
+
+        def segment(payload: Payload) -> Payload:
+            payload.pages[0].blocks = []
+            payload.pages[1].blocks = [sample_block]
+            return payload
+
+        def redactions(payload: Payload) -> Payload:
+            payload.pages[0].redactions = []
+            payload.pages[1].redactions = [sample_redaction.model_copy()]
+            return payload
+
+        def typographic(payload: Payload) -> Payload:
+            payload.typographic_profile = sample_typographic_profile
+            payload.pages[1].redactions[0].gap = sample_gap
+            return payload
+
+        def classify(payload: Payload) -> Payload:
+            payload.pages[1].redactions[0].prediction = sample_prediction
+            return payload
+
+        def candidates(payload: Payload) -> Payload:
+            payload.pages[1].redactions[0].candidates = []
+            return payload
+
+        def consolidate(payload: Payload) -> Payload:
+            assert payload.meta is not None
+            payload.output = PipelineOutput(document=payload.meta)
+            return payload
+
+        fakes = [ingest, segment, redactions, typographic, classify, candidates, consolidate]
+        by_runner = {step.runner: fn for step, fn in zip(_REGISTRY, fakes, strict=True)}
+
+        def resolve(runner: str) -> pipeline.StepFn:
+            fn = by_runner[runner]
+
+            def counted(payload: Payload) -> Payload:
+                calls.append(fn.__name__)
+                return fn(payload)
+
+            return counted
+
+        monkeypatch.setattr(pipeline, "_resolve_runner", resolve)
+        checkpoints = tmp_path / "checkpoints"
+        monkeypatch.setenv("EUU_CHECKPOINT_DIR", str(checkpoints))
+        pipeline.run_pipeline(pdf, stop_after=stop_after)
+
+        monkeypatch.delenv("EUU_CHECKPOINT_DIR")
+        calls.clear()
+        payload = pipeline.run_pipeline(pdf, resume_from=checkpoints / f"{stop_after}.json")
+
+        names = get_step_names()
+        assert calls == names[names.index(stop_after) + 1 :]
+        assert payload.completed_steps == names
+        redaction = payload.pages[1].redactions[0]
+        assert redaction.gap == sample_gap
+        assert redaction.prediction == sample_prediction
+        assert redaction.candidates == []
+        assert payload.pages[0].blocks == payload.pages[0].redactions == []
+
+    @pytest.mark.parametrize("parallel", [False, True])
+    def test_runs_hooks_around_each_step(
+        self, tmp_path, monkeypatch: pytest.MonkeyPatch, parallel: bool
+    ) -> None:
+        pdf = tmp_path / "test.pdf"
+        pdf.write_bytes(b"%PDF-1.4 fake")
+        seen: list[str] = []
+        # meta and profile are independent, so parallel runs them concurrently.
+        hooked = tuple(
+            dataclasses.replace(
+                step,
+                pre_hooks=(lambda _p, n=step.name: seen.append(f"pre {n}"),),
+                post_hooks=(lambda _p, n=step.name: seen.append(f"post {n}"),),
+            )
+            for step in _FAKE_REGISTRY[:2]
+        )
+        monkeypatch.setattr(pipeline, "_REGISTRY", hooked)
+
+        pipeline.run_pipeline(pdf, parallel=parallel)
+        assert sorted(seen) == ["post meta", "post profile", "pre meta", "pre profile"]
+        assert seen.index("pre meta") < seen.index("post meta")
+
+    def test_logs_stop_after_the_step_ran(
+        self, tmp_path, monkeypatch: pytest.MonkeyPatch, caplog: pytest.LogCaptureFixture
+    ) -> None:
+        pdf = tmp_path / "test.pdf"
+        pdf.write_bytes(b"%PDF-1.4 fake")
+        monkeypatch.setattr(pipeline, "_REGISTRY", _FAKE_REGISTRY)
+
+        with caplog.at_level(logging.INFO, logger=pipeline.__name__):
+            pipeline.run_pipeline(pdf, stop_after="profile")
+        messages = [r.getMessage() for r in caplog.records]
+        stop = next(i for i, m in enumerate(messages) if "Stopping after step [profile]" in m)
+        assert "Step [profile] completed" in messages[stop - 1]
+
+    def test_logs_steps_only_when_info_enabled(
+        self, tmp_path, monkeypatch: pytest.MonkeyPatch, caplog: pytest.LogCaptureFixture
+    ) -> None:
+        pdf = tmp_path / "test.pdf"
+        pdf.write_bytes(b"%PDF-1.4 fake")
+        monkeypatch.setattr(pipeline, "_REGISTRY", _FAKE_REGISTRY[:1])
+
+        with caplog.at_level(logging.WARNING, logger=pipeline.__name__):
+            pipeline.run_pipeline(pdf)
+        assert not caplog.records
+
+        with caplog.at_level(logging.INFO, logger=pipeline.__name__):
+            pipeline.run_pipeline(pdf)
+        assert any("Step [meta] completed" in r.getMessage() for r in caplog.records)
+
+    @pytest.mark.parametrize("parallel", [False, True])
+    def test_merges_outputs_of_concurrent_steps(
+        self, tmp_path, monkeypatch: pytest.MonkeyPatch, parallel: bool
+    ) -> None:
+        pdf = tmp_path / "test.pdf"
+        pdf.write_bytes(b"%PDF-1.4 fake")
+        monkeypatch.setattr(pipeline, "_REGISTRY", _FAKE_REGISTRY)
+
+        payload = pipeline.run_pipeline(pdf, parallel=parallel)
+
+        assert payload.output is not None
+        assert payload.output.document.filename == "fake.pdf"
+        assert payload.typographic_profile == TypographicProfile(dominant_font="Times")
+        assert [name for name, _ in payload.step_timings] == ["meta", "profile", "output"]
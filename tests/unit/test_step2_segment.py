@@ -0,0 +1,80 @@
+"""Tests for Step 2 — logical segmentation."""
+
+from __future__ import annotations
+
+import pytest
+
+from epstein_universal_unredaction.payload import PageMeta, Payload, RawTextElements
+from epstein_universal_unredaction.steps.step2_segment import run
+
+
+def _elements(*rows: tuple[str, float, float, float, float]) -> RawTextElements:
+    return RawTextElements.model_validate(
+        [
+            {"text": t, "x": x, "y": y, "w": w, "h": h, "font": "Helvetica", "size_pt": 12.0}
+            for t, x, y, w, h in rows
+        ]
+    )
+
+
+def _segment(page: PageMeta, elements: RawTextElements) -> PageMeta:
+    page.raw_text_elements = elements
+    return run(Payload(pages=[page])).pages[0]
+
+
+class TestSegment:
+    def test_requires_pages(self) -> None:
+        with pytest.raises(RuntimeError):
+            run(Payload())
+
+    def test_gap_stays_inside_line_block(self, sample_page_meta: PageMeta) -> None:
+        (block,) = run(Payload(pages=[sample_page_meta])).pages[0].blocks
+        assert block.block_id == "p0_b0"
+        assert block.text == "Name: is a resident"
+        assert block.element_indices == [0, 1]
+        assert (block.bbox.x, block.bbox.y) == pytest.approx((0.1, 0.1))
+        assert (block.bbox.w, block.bbox.h) == pytest.approx((0.45, 0.02))
+
+    def test_lines_become_blocks_in_reading_order(self, sample_page_meta: PageMeta) -> None:
+        page = _segment(
+            sample_page_meta,
+            _elements(
+                ("second", 0.3, 0.2, 0.1, 0.02),
+                ("line", 0.3, 0.1, 0.1, 0.02),
+                ("first", 0.1, 0.1, 0.1, 0.02),
+                ("line", 0.1, 0.2, 0.1, 0.02),
+            ),
+        )
+        assert [b.text for b in page.blocks] == ["first line", "line second"]
+        assert [b.element_indices for b in page.blocks] == [[2, 1], [3, 0]]
+        assert [b.block_id for b in page.blocks] == ["p0_b0", "p0_b1"]
+
+    def test_small_overlap_does_not_merge(self, sample_page_meta: PageMeta) -> None:
+        # Overlaps the line above by a quarter of its height only.
+        page = _segment(
+            sample_page_meta,
+            _elements(("upper", 0.1, 0.1, 0.1, 0.02), ("lower", 0.1, 0.115, 0.1, 0.02)),
+        )
+        assert [b.text for b in page.blocks] == ["upper", "lower"]
+
+    def test_merges_transitively(self, sample_page_meta: PageMeta) -> None:
+        # a links b and b links c, though a and c barely overlap.
+        page = _segment(
+            sample_page_meta,
+            _elements(
+                ("a", 0.1, 0.100, 0.1, 0.02),
+                ("b", 0.3, 0.108, 0.1, 0.02),
+                ("c", 0.5, 0.116, 0.1, 0.02),
+            ),
+        )
+        assert [b.text for b in page.blocks] == ["a b c"]
+
+    def test_long_chain_links_into_one_line(self, sample_page_meta: PageMeta) -> None:
+        # Each element overlaps only the next one enough to link.
+        rows = [("w", 0.1, i * 0.0004, 0.01, 0.001) for i in range(1500)]
+        (block,) = _segment(sample_page_meta, _elements(*rows)).blocks
+        assert len(block.element_indices) == 1500
+
+    def test_page_without_elements(self, sample_page_meta: PageMeta) -> None:
+        page = _segment(sample_page_meta, RawTextElements())
+        assert page.blocks == []
@@ -0,0 +1,94 @@
+"""Tests for Step 3 — redaction identification."""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+from typing import Any
+
+import numpy as np
+
+from epstein_universal_unredaction.payload import NormalisedBox, TextBlock
+from epstein_universal_unredaction.steps.step3_redactions import (
+    _DRAW_OP_DTYPE,
+    _black_boxes,
+    _block_boxes,
+    _containing_blocks,
+    _stage_draw_ops,
+)
+
+
+def _drawing(
+    fill: tuple[float, float, float] | None,
+    x0: float,
+    y0: float,
+    w: float,
+    h: float,
+    items: tuple[str, ...] = ("re",),
+) -> dict[str, Any]:
+    # Shape of one PyMuPDF ``page.get_drawings()`` entry.
+    return {
+        "fill": fill,
+        "rect": SimpleNamespace(x0=x0, y0=y0, width=w, height=h),
+        "items": [(kind,) for kind in items],
+    }
+
+
+class TestBlackBoxes:
+    def test_keeps_only_black_filled_rectangles(self) -> None:
+        ops = _stage_draw_ops(
+            [
+                _drawing((0.0, 0.0, 0.0), 60, 80, 120, 16),
+                _drawing((0.02, 0.01, 0.03), 60, 400, 60, 16),  # near-black
+                _drawing((0.137, 0.122, 0.125), 120, 560, 60, 16),  # CMYK K=100%
+                _drawing((0.5, 0.5, 0.5), 60, 200, 120, 16),
+                _drawing((0.3, 0.3, 0.3), 60, 240, 120, 16),  # dark grey, still too light
+                _drawing(None, 0, 0, 100, 100, items=("l",)),
+                _drawing((0.0, 0.0, 0.0), 0, 0, 50, 50, items=("re", "c")),
+            ],
+            page_width_pt=600,
+            page_height_pt=800,
+        )
+        assert ops.dtype == _DRAW_OP_DTYPE
+        boxes = _black_boxes(ops)
+        assert boxes.dtype == np.float32
+        expected = [[0.1, 0.1, 0.2, 0.02], [0.1, 0.5, 0.1, 0.02], [0.2, 0.7, 0.1, 0.02]]
+        np.testing.assert_allclose(boxes, expected, rtol=1e-6)
+
+    def test_no_ops(self) -> None:
+        ops = _stage_draw_ops([], page_width_pt=600, page_height_pt=800)
+        assert _black_boxes(ops).shape == (0, 4)
+
+
+def _block(block_id: str, x: float, y: float, w: float, h: float) -> TextBlock:
+    return TextBlock(block_id=block_id, bbox=NormalisedBox(x=x, y=y, w=w, h=h), text="")
+
+
+class TestContainingBlocks:
+    @staticmethod
+    def _owners(blocks: list[TextBlock], *boxes: tuple[float, float, float, float]) -> list[int]:
+        boxes_xywh = np.array(boxes, dtype=np.float32).reshape(-1, 4)
+        return _containing_blocks(_block_boxes(blocks), boxes_xywh).tolist()
+
+    def test_finds_containing_block(self, sample_block: TextBlock) -> None:
+        blocks = [_block("p0_b1", 0.1, 0.5, 0.45, 0.02), sample_block]
+        assert self._owners(blocks, (0.19, 0.1, 0.2, 0.02), (0.2, 0.5, 0.1, 0.02)) == [1, 0]
+
+    def test_prefers_largest_overlap(self) -> None:
+        upper = _block("upper", 0.1, 0.10, 0.5, 0.02)
+        lower = _block("lower", 0.1, 0.12, 0.5, 0.02)
+        assert self._owners([upper, lower], (0.2, 0.118, 0.1, 0.01)) == [1]
+
+    def test_tall_block(self) -> None:
+        tall = _block("tall", 0.1, 0.1, 0.5, 0.5)
+        blocks = [tall, _block("line", 0.1, 0.3, 0.05, 0.02)]
+        assert self._owners(blocks, (0.4, 0.5, 0.1, 0.02)) == [0]
+
+    def test_edge_contact_is_not_overlap(self) -> None:
+        block = _block("b", 0.25, 0.25, 0.25, 0.125)
+        right, below = (0.5, 0.25, 0.125, 0.125), (0.25, 0.375, 0.25, 0.125)
+        assert self._owners([block], right, below) == [-1, -1]
+
+    def test_no_overlap(self, sample_block: TextBlock) -> None:
+        assert self._owners([sample_block], (0.7, 0.1, 0.1, 0.02)) == [-1]
+        assert self._owners([], (0.0, 0.0, 1.0, 1.0)) == [-1]
+        assert self._owners([sample_block]) == []
@@ -0,0 +1,178 @@
+"""Tests for Step 6 — dictionary width matching."""
+
+from __future__ import annotations
+
+import math
+
+import numpy as np
+import pytest
+
+from epstein_universal_unredaction.payload import (
+    RedactedDataType,
+    RedactionContext,
+    SemanticPrediction,
+)
+from epstein_universal_unredaction.steps import _step6_kernels
+from epstein_universal_unredaction.steps.step6_candidates import (
+    _batch_redactions,
+    _batch_target,
+    _candidate_widths,
+    _pack_strings,
+    _score_packed,
+    _top_candidates,
+    _width_lut,
+)
+
+_CHAR_WIDTHS = {"i": 1.0, "W": 4.0, " ": 1.5}
+
+
+def _widths(texts: list[str], tracking_mm: float = 0.0) -> list[float]:
+    lut = _width_lut(_CHAR_WIDTHS, default_width_mm=2.5)
+    widths = _candidate_widths(*_pack_strings(texts), lut, tracking_mm)
+    assert widths.dtype == np.float32
+    return widths.tolist()
+
+
+class TestCandidateWidths:
+    def test_sums_char_widths(self) -> None:
+        assert _widths(["iWi", "W W", "ab"]) == pytest.approx([6.0, 9.5, 5.0])
+
+    def test_tracking_between_characters_only(self) -> None:
+        assert _widths(["iWi", "W", ""], tracking_mm=0.5) == pytest.approx([7.0, 4.0, 0.0])
+
+    def test_multibyte_character_charged_once(self) -> None:
+        assert _widths(["é", "Zoë"], tracking_mm=0.5) == pytest.approx([2.5, 8.5])
+
+    def test_latin1_metrics_are_kept(self) -> None:
+        metrics = {"J": 1.5, "o": 2.0, "s": 1.75, "é": 2.25, "ñ": 2.5, "ü": 2.0, "Ö": 3.0}
+        lut = _width_lut(metrics, default_width_mm=9.0)
+        name = "JoséñüÖ"
+        widths = _candidate_widths(*_pack_strings([name, "é€"]), lut, tracking_mm=0.25)
+        expected = sum(metrics[c] for c in name) + 0.25 * (len(name) - 1)
+        # Characters beyond Latin-1 still fall back to the default width.
+        assert widths.tolist() == pytest.approx([expected, 2.25 + 0.25 + 9.0])
+
+    def test_no_candidates(self) -> None:
+        assert _widths([]) == []
+
+
+class TestTopCandidates:
+    def test_ranks_by_width_match(self) -> None:
+        widths = np.array([10.0, 12.0, 9.5, 30.0, 11.0], dtype=np.float32)
+        texts = ["a", "b", "c", "d", "e"]
+        top = _top_candidates(texts, widths, gap_width_mm=10.0, top_n=3)
+        assert [c.text for c in top] == ["a", "c", "e"]
+        assert top[0].score == pytest.approx(1.0)
+        assert top[1].width_delta_mm == pytest.approx(-0.5)
+        assert top[2].score == pytest.approx(math.exp(-0.5))
+
+    def test_ties_keep_input_order(self) -> None:
+        widths = np.array([11.0, 9.0, 11.0], dtype=np.float32)
+        top = _top_candidates(["x", "y", "z"], widths, gap_width_mm=10.0)
+        assert [c.text for c in top] == ["x", "y", "z"]
+
+    def test_ties_at_the_cut_keep_input_order(self) -> None:
+        # Score 1.0 for "c", then four candidates tied for the last two places.
+        widths = np.array([12.0, 8.0, 10.0, 11.0, 9.0, 11.0, 9.0], dtype=np.float32)
+        top = _top_candidates(list("abcdefg"), widths, gap_width_mm=10.0, top_n=3)
+        assert [c.text for c in top] == ["c", "d", "e"]
+
+        texts = [str(i) for i in range(1000)]
+        top = _top_candidates(texts, np.full(1000, 10.0, np.float32), gap_width_mm=10.0, top_n=5)
+        assert [c.text for c in top] == ["0", "1", "2", "3", "4"]
+
+    def test_drops_zero_width(self) -> None:
+        widths = np.array([0.0, 10.0], dtype=np.float32)
+        top = _top_candidates(["", "a"], widths, gap_width_mm=0.5, top_n=5)
+        assert [c.text for c in top] == ["a"]
+
+    def test_no_candidates(self) -> None:
+        assert _top_candidates([], np.empty(0, dtype=np.float32), gap_width_mm=10.0) == []
+
+
+class TestScorePacked:
+    _TEXTS = ("iWi", "W W", "", "Zoë", "é")
+
+    _LUT = _width_lut({**_CHAR_WIDTHS, "ë": 2.0}, default_width_mm=2.5)
+
+    def _score(self) -> tuple[list[float], list[float]]:
+        lut = self._LUT
+        widths, scores = _score_packed(*_pack_strings(self._TEXTS), lut, 0.5, gap_width_mm=8.0)
+        return widths.tolist(), scores.tolist()
+
+    def test_numpy_path(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(_step6_kernels, "score_candidates", None)
+        widths, scores = self._score()
+        assert widths == pytest.approx([7.0, 10.5, 0.0, 8.0, 2.5])
+        assert scores[2] == -1.0
+        assert scores[3] == pytest.approx(1.0)
+        assert scores[0] == pytest.approx(math.exp(-0.5))
+
+    def test_kernel_matches_numpy_path(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        # The uncompiled kernel has the same semantics as the jitted one.
+        monkeypatch.setattr(_step6_kernels, "score_candidates", None)
+        expected = self._score()
+        monkeypatch.setattr(_step6_kernels, "score_candidates", _step6_kernels._score_candidates)
+        widths, scores = self._score()
+        assert widths == pytest.approx(expected[0])
+        assert scores == pytest.approx(expected[1])
+
+    def test_scores_feed_top_candidates(self) -> None:
+        widths, scores = _score_packed(
+            *_pack_strings(self._TEXTS), self._LUT, 0.5, gap_width_mm=8.0
+        )
+        top = _top_candidates(self._TEXTS, widths, 8.0, scores=scores, top_n=2)
+        assert [c.text for c in top] == ["Zoë", "iWi"]
+        assert top[0].width_delta_mm == pytest.approx(0.0)
+
+
+class TestBatchRedactions:
+    @staticmethod
+    def _redactions(
+        base: RedactionContext, *types: RedactedDataType | None
+    ) -> list[RedactionContext]:
+        return [
+            base.model_copy(
+                update={
+                    "redaction_id": f"r{i}",
+                    "prediction": None if t is None else SemanticPrediction(predicted_type=t),
+                }
+            )
+            for i, t in enumerate(types)
+        ]
+
+    @staticmethod
+    def _ids(batches: list[list[RedactionContext]]) -> list[list[str]]:
+        return [[r.redaction_id for r in batch] for batch in batches]
+
+    def test_small_redactions_share_a_batch(self, sample_redaction: RedactionContext) -> None:
+        redactions = self._redactions(
+            sample_redaction, RedactedDataType.PHONE, RedactedDataType.NAME, RedactedDataType.DATE
+        )
+        assert self._ids(_batch_redactions(redactions, 250_000)) == [["r1", "r2", "r0"]]
+
+    def test_first_fit_decreasing(self, sample_redaction: RedactionContext) -> None:
+        redactions = self._redactions(
+            sample_redaction,
+            RedactedDataType.PHONE,
+            RedactedDataType.NAME,
+            RedactedDataType.NAME,
+            RedactedDataType.NAME,
+            RedactedDataType.EMAIL,
+        )
+        batches = _batch_redactions(redactions, 250_000)
+        assert self._ids(batches) == [["r1", "r2", "r4"], ["r3", "r0"]]
+
+    def test_oversized_redaction_gets_own_batch(self, sample_redaction: RedactionContext) -> None:
+        # No prediction counts as UNKNOWN, the broad dictionary.
+        redactions = self._redactions(sample_redaction, RedactedDataType.PHONE, None)
+        assert self._ids(_batch_redactions(redactions, 100_000)) == [["r1"], ["r0"]]
+
+    def test_no_redactions(self) -> None:
+        assert _batch_redactions([], 250_000) == []
+
+    def test_target_from_environment(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.delenv("EUU_STEP6_BATCH_CANDIDATE_COUNT", raising=False)
+        assert _batch_target() == 250_000
+        monkeypatch.setenv("EUU_STEP6_BATCH_CANDIDATE_COUNT", "1000")
+        assert _batch_target() == 1000
@@ -0,0 +1,55 @@
+"""Tests for memory-mapped string bundles."""
+
+from __future__ import annotations
+
+import pickle
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from epstein_universal_unredaction.steps.step6_candidates import _candidate_widths, _width_lut
+from epstein_universal_unredaction.utils.string_bundle import StringBundle, write_bundle
+
+_NAMES = ["John Smith", "", "Zoë Ångström", "Li"]
+
+
+@pytest.fixture()
+def bundle(tmp_path: Path) -> StringBundle:
+    write_bundle(tmp_path / "names", _NAMES)
+    return StringBundle(tmp_path / "names")
+
+
+class TestStringBundle:
+    def test_round_trip(self, bundle: StringBundle) -> None:
+        assert len(bundle) == len(_NAMES)
+        assert [bundle[i] for i in range(len(bundle))] == _NAMES
+        assert bundle[-1] == "Li"
+        assert bundle.texts([2, 0]) == ["Zoë Ångström", "John Smith"]
+        with pytest.raises(IndexError):
+            bundle[len(_NAMES)]
+
+    def test_is_memory_mapped(self, bundle: StringBundle) -> None:
+        assert isinstance(bundle.buffer, np.memmap)
+        assert isinstance(bundle.offsets, np.memmap)
+        assert not bundle.buffer.flags.writeable
+
+    def test_pickles_by_path(self, tmp_path: Path) -> None:
+        names = [f"name_{i:06d}" for i in range(50_000)]
+        write_bundle(tmp_path / "large", names)
+        bundle = StringBundle(tmp_path / "large")
+        assert bundle.buffer.nbytes > 500_000
+
+        data = pickle.dumps(bundle)
+        # Only the path travels; the buffer and offsets stay on disk.
+        assert len(data) < 1_000
+        assert pickle.loads(data).texts([0, 49_999]) == ["name_000000", "name_049999"]
+
+    def test_feeds_width_calculation(self, bundle: StringBundle) -> None:
+        lut = _width_lut({}, default_width_mm=1.0)
+        widths = _candidate_widths(bundle.buffer, bundle.offsets, lut, tracking_mm=0.0)
+        assert widths.tolist() == [float(len(name)) for name in _NAMES]
+
+    def test_empty_bundle(self, tmp_path: Path) -> None:
+        write_bundle(tmp_path / "empty", [])
+        assert len(StringBundle(tmp_path / "empty")) == 0